@@ -1,87 +1,282 @@
-import pyautogui
+import math
 import time
-from typing import List, Tuple, Dict
+from dataclasses import dataclass
+from typing import List, Tuple, Dict, Optional
+from input_backend import InputBackend, make_input
+from tracing import tracer, traced
+
+#"cells" moves to every cell and pauses there, "turns" drags straight runs in one timed stream
+DRAW_MODES = ("cells", "turns")
+
+#How draw_and_verify() adapts the drawing speed for next time
+SLOWDOWN = 1.5              # Timing multiplier after the game missed a cell
+SPEEDUP = 0.9               # Timing multiplier after a clean draw
+MIN_STEP_INTERVAL = 0.002   # Fastest "turns" mode schedule
+MIN_PAUSE_AT_CELL = 0.01    # Shortest "cells" mode pause
+
+@dataclass
+class DrawReport:
+    """What a draw_path() call did, for comparing drawing modes."""
+    mode: str
+    cells: int
+    events: int         # Mouse moves and button presses sent
+    elapsed: float      # Seconds from the first mouse move to releasing the button
+
+def wait_until(deadline: float):
+    """Wait for a time.perf_counter() deadline: sleep most of the way, spin the last 2 ms."""
+    remaining = deadline - time.perf_counter()
+    if remaining > 0.002:
+        time.sleep(remaining - 0.002)
+    while time.perf_counter() < deadline:
+        pass
 
 class ZipAutomation:
-    def __init__ (self, cell_positions: Dict[Tuple[int, int], Tuple[int, int]]):
+    def __init__ (self, cell_positions: Dict[Tuple[int, int], Tuple[int, int]],
+                  move_duration: float = 0.05, pause_at_cell: float = 0.1,
+                  mode: str = "cells", step_interval: float = 0.01, max_step_cells: float = 1.0,
+                  input_backend: Optional[InputBackend] = None):
         """
         Initialize automation with cell positions from vision system
         Args:
             cell_positions: Dict mapping (row, col) to (screen_x, screen_y)
+            move_duration, pause_at_cell: Default timings for draw_path() in "cells" mode
+            mode: Default drawing mode, one of DRAW_MODES
+            step_interval: Seconds between mouse moves in "turns" mode
+            max_step_cells: Longest mouse move in "turns" mode, in cells, so the game registers every cell
+            input_backend: Where mouse events go (see input_backend.py), defaults to pyautogui
         """
+        if mode not in DRAW_MODES:
+            raise ValueError(f"Unknown drawing mode '{mode}', expected one of {DRAW_MODES}")
         self.cell_positions = cell_positions
+        self.move_duration = move_duration
+        self.pause_at_cell = pause_at_cell
+        self.mode = mode
+        self.step_interval = step_interval
+        self.max_step_cells = max_step_cells
+        self.input = input_backend if input_backend is not None else make_input()
 
-        #Safety: Allows user to move mouse to corner to stop
-        pyautogui.FAILSAFE = True
-
-        #Allows reasonable speed, can be adjusted
-        pyautogui.PAUSE = 0.01 #10ms between actions
+    @classmethod
+    def from_profile(cls, profile) -> "ZipAutomation":
+        """Automation with the cell positions and timings of a saved CalibrationProfile."""
+        return cls(profile.cell_positions, profile.move_duration, profile.pause_at_cell,
+                   profile.draw_mode, profile.step_interval, input_backend=make_input(profile.input_backend))
 
-    def draw_path(self, path: List[Tuple[int, int]], move_duration: float = 0.05, pause_at_cell: float = 0.1):
+    @traced("automation.draw")
+    def draw_path(self, path: List[Tuple[int, int]], move_duration: Optional[float] = None,
+                  pause_at_cell: Optional[float] = None, countdown: int = 3,
+                  mode: Optional[str] = None) -> Optional[DrawReport]:
         """
         Draw the complete solution path by clicking and dragging through all cells.
 
         Args:
             path: List of (row, col) coordinates representing the Hamiltonian path
-            move_duration: How long each drag movement takes (seconds)
-            pause_at_cell: How long to pause at each cell for game to register (seconds)
+            move_duration: How long each drag movement takes (seconds), defaults to self.move_duration
+            pause_at_cell: How long to pause at each cell for game to register (seconds),
+                           defaults to self.pause_at_cell
+            countdown: Seconds to wait before starting, 0 to start right away
+            mode: Drawing mode, one of DRAW_MODES, defaults to self.mode
+
+        Returns:
+            DrawReport with the time taken and events sent, None if nothing was drawn
         """
+        move_duration = self.move_duration if move_duration is None else move_duration
+        pause_at_cell = self.pause_at_cell if pause_at_cell is None else pause_at_cell
+        mode = self.mode if mode is None else mode
+
         if not path or len(path) < 2:
             print("Path too short to draw (need at least 2 cells).")
-            return
+            return None
+
+        for cell in path:
+            if cell not in self.cell_positions:
+                raise KeyError(f"Cell {cell} not found in position map")
         
         print(f"\n{'='*60}")
         print(f"DRAWING SOLUTION PATH")
         print(f"{'='*60}")
         print(f"Path length: {len(path)} cells")
         print(f"SAFETY: Move mouse to corner to abort!")
-        print("\nStarting in 3 seconds...")
+        if countdown:
+            print(f"\nStarting in {countdown} seconds...")
         
-        for i in range(3, 0, -1):
-            print(f"  {i}...")
-            time.sleep(1)
+        with tracer.span("automation.countdown"):
+            for i in range(countdown, 0, -1):
+                print(f"  {i}...")
+                time.sleep(1)
         
         print("\n🖱️  Starting automation!\n")
         
+        if mode == "turns":
+            return self.stream_path(path)
+
         # Get screen position of first cell
         start_cell = path[0]
-        if start_cell not in self.cell_positions:
-            raise KeyError(f"Start cell {start_cell} not found in position map")
-        
         start_x, start_y = self.cell_positions[start_cell]
         
         # Move to start position and click down
         print(f"Starting at {start_cell} ({start_x}, {start_y})")
-        pyautogui.moveTo(start_x, start_y, duration=0.2)
+        start_time = time.perf_counter()
+        self.input.move(start_x, start_y, duration=0.2)
+        self.input.flush()
         time.sleep(0.1)
-        pyautogui.mouseDown(button='left')
+        self.input.press()
+        events = 2
         
         try:
             # Drag through each subsequent cell
             for i in range(1, len(path)):
                 cell = path[i]
-                
-                if cell not in self.cell_positions:
-                    pyautogui.mouseUp(button='left')
-                    raise KeyError(f"Cell {cell} not found in position map")
-                
                 x, y = self.cell_positions[cell]
                 
                 print(f"  [{i}/{len(path)-1}] → {cell} at ({x}, {y})")
-                pyautogui.moveTo(x, y, duration=move_duration)
+                self.input.move(x, y, duration=move_duration)
+                self.input.flush()
+                events += 1
                 time.sleep(pause_at_cell)  # Pause so game registers the cell
             
             # Release mouse
             time.sleep(0.05)
-            pyautogui.mouseUp(button='left')
-            
-            print(f"\n✓ Path drawn successfully: {path[0]} → {path[-1]}")
-            print(f"{'='*60}\n")
+            self.input.release()
+            self.input.flush()
+            events += 1
             
-        except pyautogui.FailSafeException:
+        except self.input.abort_exceptions:
             print("\n⚠️  Automation aborted by failsafe (mouse moved to corner)")
-            pyautogui.mouseUp(button='left')
-            return
+            self.input.release()
+            self.input.flush()
+            return None
+
+        report = DrawReport("cells", len(path), events, time.perf_counter() - start_time)
+        print(f"\n✓ Path drawn successfully: {path[0]} → {path[-1]}")
+        print(f"  {report.elapsed * 1000:.0f} ms, {report.events} input events")
+        print(f"{'='*60}\n")
+        return report
+
+    @traced("automation.draw_verified")
+    def draw_and_verify(self, path: List[Tuple[int, int]], vision, retries: int = 2,
+                        settle: float = 0.15, countdown: int = 3) -> bool:
+        """
+        Draw the path, then check on screen which cells the game filled and redraw from the
+        first one it missed. The timing of the current mode adapts for the next draw: slower
+        after a miss, a little faster after a clean draw.
+
+        Args:
+            path: Solution path to draw
+            vision: ZipVision of the board, used to capture it and find the filled cells
+            retries: Redraws to try before giving up
+            settle: Seconds to let the game redraw before capturing
+            countdown: Seconds to wait before the first draw
+
+        Returns:
+            True if every cell of the path shows as filled
+        """
+        if self.draw_path(path, countdown=countdown) is None:
+            return False
+
+        clean = True
+        for attempt in range(retries + 1):
+            with tracer.span("automation.verify"):
+                time.sleep(settle)
+                filled = vision.path_cells(vision.capture_board())
+            missed = next((index for index, cell in enumerate(path) if not filled[cell]), None)
+            if missed is None:
+                break
+
+            clean = False
+            self.adapt_speed(slower=True)
+            if attempt == retries:
+                print(f"⚠ Game still missed {path[missed]} after {retries} redraws")
+                return False
+
+            # Pick the path back up at the last cell the game has
+            restart = max(0, missed - 1)
+            print(f"⚠ Game missed {path[missed]} (cell {missed + 1}/{len(path)}), "
+                  f"redrawing from {path[restart]} at a slower speed")
+            if self.draw_path(path[restart:], countdown=0) is None:
+                return False
+
+        if clean:
+            self.adapt_speed(slower=False)
+        print(f"✓ Drawing verified, all {len(path)} cells filled")
+        return True
+
+    def adapt_speed(self, slower: bool):
+        """Scale the timing of the current drawing mode by SLOWDOWN or SPEEDUP."""
+        factor = SLOWDOWN if slower else SPEEDUP
+        if self.mode == "turns":
+            self.step_interval = max(MIN_STEP_INTERVAL, self.step_interval * factor)
+        else:
+            self.pause_at_cell = max(MIN_PAUSE_AT_CELL, self.pause_at_cell * factor)
+
+    @staticmethod
+    def turn_points(path: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """The start, every cell where the path changes direction, and the end."""
+        points = [path[0]]
+        for previous, cell, following in zip(path, path[1:], path[2:]):
+            if (cell[0] - previous[0], cell[1] - previous[1]) != (following[0] - cell[0], following[1] - cell[1]):
+                points.append(cell)
+        points.append(path[-1])
+        return points
+
+    def stream_positions(self, path: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Screen positions to move through after the first cell: each straight run between turn
+        points is split into equal steps of at most max_step_cells cells, ending on the turn.
+        """
+        positions = []
+        points = self.turn_points(path)
+        for start, end in zip(points, points[1:]):
+            (start_x, start_y), (end_x, end_y) = self.cell_positions[start], self.cell_positions[end]
+            run = abs(end[0] - start[0]) + abs(end[1] - start[1])
+            steps = max(1, math.ceil(run / self.max_step_cells))
+            for step in range(1, steps + 1):
+                positions.append((round(start_x + (end_x - start_x) * step / steps),
+                                  round(start_y + (end_y - start_y) * step / steps)))
+        return positions
+
+    def stream_path(self, path: List[Tuple[int, int]]) -> Optional[DrawReport]:
+        """
+        Draw the path as one continuous drag through its turn points. Moves are sent on a
+        fixed step_interval schedule against time.perf_counter(), without the input backend's
+        own pauses, so the only waiting is the schedule itself.
+        """
+        positions = self.stream_positions(path)
+        start_x, start_y = self.cell_positions[path[0]]
+        print(f"Starting at {path[0]} ({start_x}, {start_y}), {len(positions)} moves "
+              f"through {len(self.turn_points(path))} turn points")
+
+        start_time = time.perf_counter()
+        self.input.move(start_x, start_y)
+        self.input.press()
+        self.input.flush()
+        events = 2
+        deadline = time.perf_counter()
+
+        try:
+            for x, y in positions:
+                deadline += self.step_interval
+                wait_until(deadline)
+                self.input.move(x, y)
+                self.input.flush()
+                events += 1
+
+            # Let the game register the last cell before releasing
+            wait_until(deadline + self.step_interval)
+            self.input.release()
+            self.input.flush()
+            events += 1
+
+        except self.input.abort_exceptions:
+            print("\n⚠️  Automation aborted by failsafe (mouse moved to corner)")
+            self.input.release()
+            self.input.flush()
+            return None
+
+        report = DrawReport("turns", len(path), events, time.perf_counter() - start_time)
+        print(f"\n✓ Path drawn successfully: {path[0]} → {path[-1]}")
+        print(f"  {report.elapsed * 1000:.0f} ms, {report.events} input events")
+        print(f"{'='*60}\n")
+        return report
 
     def preview_path_positions(self, path: List[Tuple[int, int]]):
         """
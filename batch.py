@@ -0,0 +1,211 @@
+"""
+Headless batch solving: run vision and the solver over a directory of boards, no screen or prompts.
+Run with: py batch.py <directory> [--workers N] [--output results.jsonl]
+
+The directory can hold board screenshots (.png/.jpg, cropped to the board) and board
+descriptions (.json). A .json next to an image with the same name is that image's labels:
+the detected numbers are checked against it. A .json on its own is solved directly.
+
+Board JSON: {"rows": 7, "cols": 7, "numbers": [[row, col, number], ...],
+             "walls": [[row1, col1, row2, col2], ...]}   (walls optional)
+"""
+import argparse
+import cv2
+import contextlib
+import io
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import partial
+from typing import Tuple, List, Dict, Set, Optional
+from vision import ZipVision
+from solver import ZipSolver
+from recognizer import DigitRecognizer, DEFAULT_TEMPLATES
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+STAGES = ("load", "grid", "numbers", "walls", "pairs", "solve")
+
+Cell = Tuple[int, int]
+
+recognizers = {}    # Templates path -> DigitRecognizer, loaded once per worker process
+
+def load_board(json_path: str) -> Tuple[Tuple[int, int], Dict[Cell, int], Set[Tuple[Cell, Cell]]]:
+    """
+    Read a board description (see the module docstring).
+
+    Returns:
+        ((rows, cols), {(row, col): number}, {((r1, c1), (r2, c2)), ...})
+    """
+    with open(json_path) as f:
+        data = json.load(f)
+    numbers = {(row, col): number for row, col, number in data["numbers"]}
+    walls = {((r1, c1), (r2, c2)) for r1, c1, r2, c2 in data.get("walls", [])}
+    return (data["rows"], data["cols"]), numbers, walls
+
+def find_boards(directory: str) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    List the boards in a directory.
+
+    Returns:
+        (name, image_path, json_path) for each board, image_path is None for JSON-only boards
+    """
+    boards = []
+    names = sorted(os.listdir(directory))
+    for name in names:
+        stem, extension = os.path.splitext(name)
+        json_path = os.path.join(directory, stem + ".json")
+        json_path = json_path if os.path.exists(json_path) else None
+        if extension.lower() in IMAGE_EXTENSIONS:
+            boards.append((name, os.path.join(directory, name), json_path))
+        elif extension.lower() == ".json" and not any(
+                os.path.splitext(other)[0] == stem and os.path.splitext(other)[1].lower() in IMAGE_EXTENSIONS
+                for other in names):
+            boards.append((name, None, json_path))
+    return boards
+
+def get_recognizer(templates_path: Optional[str]):
+    if templates_path not in recognizers:
+        recognizers[templates_path] = DigitRecognizer(templates_path)
+    return recognizers[templates_path]
+
+def process_board(board: Tuple[str, Optional[str], Optional[str]], templates_path: Optional[str] = None,
+                  timeout: Optional[float] = None, strategy: str = "recursive", verbose: bool = False,
+                  stats: bool = False) -> Dict:
+    """
+    Read and solve one board, timing every stage.
+
+    Returns:
+        Result record: board, status, grid, counts, path and timings_ms per stage,
+        plus search_stats (see SearchStats) if stats is set
+    """
+    name, image_path, json_path = board
+    record = {"board": name, "source": "image" if image_path else "json"}
+    timings = {}
+    start = time.perf_counter()
+    stage_start = start
+
+    def lap(stage: str):
+        nonlocal stage_start
+        now = time.perf_counter()
+        timings[stage] = round((now - stage_start) * 1000, 3)
+        stage_start = now
+
+    output = io.StringIO()
+    try:
+        # Vision and the solver print progress, keep it out of the results unless asked
+        with contextlib.nullcontext() if verbose else contextlib.redirect_stdout(output):
+            vision = ZipVision()
+            if image_path:
+                img = cv2.imread(image_path)
+                if img is None:
+                    raise ValueError(f"Couldn't read image {image_path}")
+                vision.board_area = (0, 0, img.shape[1], img.shape[0])
+                lap("load")
+
+                record["grid_confidence"] = round(vision.detect_grid_structure(img), 3)
+                grid_size = vision.grid_size
+                lap("grid")
+
+                numbers = vision.detect_numbers_at_cells(img, get_recognizer(templates_path))
+                lap("numbers")
+
+                walls = vision.wall_edges(*vision.detect_wall_grid(img))
+                lap("walls")
+
+                if json_path:
+                    label_size, label_numbers, _ = load_board(json_path)
+                    record["numbers_correct"] = label_size == grid_size and numbers == label_numbers
+            else:
+                grid_size, numbers, walls = load_board(json_path)
+                lap("load")
+
+            pairs = vision.identify_pairs_from_numbers(numbers)
+            lap("pairs")
+
+            record.update(grid=list(grid_size), numbers=len(numbers), walls=len(walls))
+            if not pairs:
+                raise ValueError("No consecutive numbers found")
+
+            solver = ZipSolver(grid_size, pairs, walls or None, strategy=strategy, collect_stats=stats)
+            result = solver.solve(timeout=timeout)
+            lap("solve")
+            if stats:
+                record["search_stats"] = dict(asdict(solver.stats), nodes_per_second=round(solver.stats.nodes_per_second))
+
+        record.update(status=result.status.name.lower(), nodes_expanded=result.nodes_expanded,
+                      path=[list(cell) for cell in result.path])
+    except Exception as e:
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+
+    timings["total"] = round((time.perf_counter() - start) * 1000, 3)
+    record["timings_ms"] = timings
+    return record
+
+def run_batch(directory: str, output_path: str, workers: int = 1, templates_path: Optional[str] = None,
+              timeout: Optional[float] = None, strategy: str = "recursive", verbose: bool = False,
+              stats: bool = False) -> List[Dict]:
+    """
+    Process every board in a directory and write one JSON line per board to output_path.
+    With workers > 1 boards are spread over that many processes, results keep directory order.
+    """
+    boards = find_boards(directory)
+    if not boards:
+        print(f"⚠ No boards found in {directory}")
+        return []
+
+    options = dict(templates_path=templates_path, timeout=timeout, strategy=strategy, verbose=verbose, stats=stats)
+    start = time.perf_counter()
+    records = []
+    with open(output_path, "w") as output:
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for record in pool.map(partial(process_board, **options), boards):
+                    output.write(json.dumps(record) + "\n")
+                    records.append(record)
+        else:
+            for board in boards:
+                record = process_board(board, **options)
+                output.write(json.dumps(record) + "\n")
+                records.append(record)
+    elapsed = time.perf_counter() - start
+
+    print_summary(records, elapsed)
+    print(f"✓ Results written to {output_path}")
+    return records
+
+def print_summary(records: List[Dict], elapsed: float):
+    solved = sum(record["status"] == "solved" for record in records)
+    errors = [record for record in records if record["status"] == "error"]
+    print(f"{len(records)} boards, {solved} solved, {len(errors)} errors in {elapsed:.2f}s "
+          f"({len(records) / elapsed:.1f} boards/s)")
+
+    print(f"\n{'Stage':<10} {'Median':>10} {'Max':>10}")
+    print("-" * 32)
+    for stage in STAGES + ("total",):
+        times = [record["timings_ms"][stage] for record in records if stage in record["timings_ms"]]
+        if times:
+            print(f"{stage:<10} {statistics.median(times):>8.2f}ms {max(times):>8.2f}ms")
+
+    labelled = [record["numbers_correct"] for record in records if "numbers_correct" in record]
+    if labelled:
+        print(f"\nNumbers read correctly on {sum(labelled)}/{len(labelled)} labelled screenshots")
+    for record in errors:
+        print(f"⚠ {record['board']}: {record['error']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve a directory of Zip boards without a screen.")
+    parser.add_argument("directory", help="Board screenshots and/or board JSON files")
+    parser.add_argument("--output", default="batch_results.jsonl", help="JSON lines file to write")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--templates", default=DEFAULT_TEMPLATES, help="Digit templates for the recognizer")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds before giving up on a board")
+    parser.add_argument("--strategy", default="recursive", help="ZipSolver search strategy")
+    parser.add_argument("--verbose", action="store_true", help="Show vision and solver output")
+    parser.add_argument("--stats", action="store_true", help="Record solver search statistics per board")
+    args = parser.parse_args()
+
+    run_batch(args.directory, args.output, args.workers, args.templates, args.timeout, args.strategy, args.verbose,
+              args.stats)
@@ -0,0 +1,288 @@
+"""
+Solver benchmarks on a fixed, reproducible puzzle set.
+Run with: py benchmark.py
+OCR benchmark on labelled screenshots: py benchmark.py ocr <directory>
+Screen capture backends (needs a display): py benchmark.py capture
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import statistics
+import time
+from typing import List, Tuple, Set
+from solver import ZipSolver, ORDERINGS, STRATEGIES, solve_portfolio
+
+Cell = Tuple[int, int]
+Puzzle = Tuple[Tuple[int, int], List[Tuple[Cell, Cell]], Set[Tuple[Cell, Cell]]]
+
+def random_puzzle(rows: int, cols: int, num_nodes: int, num_walls: int, seed: int) -> Puzzle:
+    """
+    Generate a solvable puzzle: scramble a snake path with backbite moves, place the
+    numbered nodes along it and add walls on edges the path doesn't use.
+
+    Returns:
+        (grid_size, pairs, walls) ready to pass to ZipSolver
+    """
+    rng = random.Random(seed)
+    path = [(r, c if r % 2 == 0 else cols - 1 - c) for r in range(rows) for c in range(cols)]
+
+    for _ in range(rows * cols * 20):
+        if rng.random() < 0.5:
+            path.reverse()
+        end = path[-1]
+        candidates = [(end[0] + dr, end[1] + dc) for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]]
+        candidates = [cell for cell in candidates
+                      if 0 <= cell[0] < rows and 0 <= cell[1] < cols and cell != path[-2]]
+        i = path.index(rng.choice(candidates))
+        path[i + 1:] = reversed(path[i + 1:])
+
+    middle = sorted(rng.sample(range(1, len(path) - 1), num_nodes - 2))
+    nodes = [path[0]] + [path[i] for i in middle] + [path[-1]]
+    pairs = list(zip(nodes, nodes[1:]))
+
+    used = set(zip(path, path[1:])) | set(zip(path[1:], path))
+    edges = [((r, c), (r + dr, c + dc)) for r in range(rows) for c in range(cols)
+             for dr, dc in [(1, 0), (0, 1)] if r + dr < rows and c + dc < cols]
+    edges = [edge for edge in edges if edge not in used]
+    walls = set(rng.sample(edges, min(num_walls, len(edges))))
+    return (rows, cols), pairs, walls
+
+def puzzle_set(sizes: Tuple[int, ...] = (6, 7, 8), per_size: int = 5) -> List[Puzzle]:
+    """Fixed benchmark corpus: per_size puzzles of each square size, one node and wall per row."""
+    return [random_puzzle(size, size, size, size, seed) for size in sizes for seed in range(per_size)]
+
+def bench_nodes_per_second(puzzles: List[Puzzle], repeats: int = 3, **solver_options):
+    """Time the DFS over the puzzle set and report nodes expanded per second."""
+    best_time = float('inf')
+    total_nodes = 0
+
+    for _ in range(repeats):
+        total_nodes = 0
+        start_time = time.perf_counter()
+        for grid_size, pairs, walls in puzzles:
+            solver = ZipSolver(grid_size, pairs, walls, **solver_options)
+            solver.solve()
+            total_nodes += solver.nodes_expanded
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    print(f"{solver_options or 'defaults'}: {len(puzzles)} puzzles, {total_nodes} nodes in {best_time:.3f}s "
+          f"({total_nodes / best_time:,.0f} nodes/s)")
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of values, fraction in [0, 1]."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+def bench_orderings(puzzles: List[Puzzle], **solver_options):
+    """Report median and p99 nodes expanded per move ordering policy over the puzzle set."""
+    print(f"{'Ordering':<14} {'Median nodes':>12} {'p99 nodes':>10} {'Time':>8}")
+    print("-" * 47)
+    for ordering in ORDERINGS:
+        nodes = []
+        start_time = time.perf_counter()
+        for grid_size, pairs, walls in puzzles:
+            solver = ZipSolver(grid_size, pairs, walls, ordering=ordering, **solver_options)
+            solver.solve()
+            nodes.append(solver.nodes_expanded)
+        elapsed = time.perf_counter() - start_time
+        print(f"{ordering:<14} {statistics.median(nodes):>12.0f} {percentile(nodes, 0.99):>10} {elapsed:>7.2f}s")
+
+def bench_strategies(puzzles: List[Puzzle], timeout: float = 30.0):
+    """Report median/p99 nodes expanded and total time per search engine over the puzzle set."""
+    print(f"{'Strategy':<14} {'Median nodes':>12} {'p99 nodes':>10} {'Time':>8}")
+    print("-" * 47)
+    for strategy in STRATEGIES:
+        nodes = []
+        start_time = time.perf_counter()
+        for grid_size, pairs, walls in puzzles:
+            result = ZipSolver(grid_size, pairs, walls, strategy=strategy).solve(timeout=timeout)
+            nodes.append(result.nodes_expanded)
+        elapsed = time.perf_counter() - start_time
+        print(f"{strategy:<14} {statistics.median(nodes):>12.0f} {percentile(nodes, 0.99):>10} {elapsed:>7.2f}s")
+
+def bench_backends(sizes: Tuple[int, ...] = (6, 8, 10, 12), per_size: int = 5, timeout: float = 20.0):
+    """
+    DFS vs the CP-SAT backend by board size: median solve time and how many boards
+    each one finished within the timeout. Shows where the exact backend overtakes the DFS.
+    """
+    print(f"{'Board':<8} {'DFS median':>11} {'solved':>7} {'CP-SAT median':>14} {'solved':>7}")
+    print("-" * 52)
+    for size in sizes:
+        puzzles = [random_puzzle(size, size, size, size, seed) for seed in range(per_size)]
+        row = f"{size}x{size}"
+        print(f"{row:<8}", end="")
+        for strategy in ("recursive", "cp_sat"):
+            times = []
+            solved = 0
+            for grid_size, pairs, walls in puzzles:
+                result = ZipSolver(grid_size, pairs, walls, strategy=strategy).solve(timeout=timeout)
+                times.append(result.elapsed)
+                solved += bool(result)
+            width = 11 if strategy == "recursive" else 14
+            print(f" {statistics.median(times):>{width - 1}.2f}s {solved:>4}/{per_size}", end="")
+        print()
+
+def bench_portfolio(puzzles: List[Puzzle], workers: int, split_depth: int = 6, min_seconds: float = 0.5):
+    """
+    Compare the single-process solver with solve_portfolio (racing configs, and one search
+    split at split_depth) on the puzzles the single-process solver needs min_seconds for.
+    """
+    print(f"{'Board':<8} {'Single':>8} {'Portfolio':>10} {'Split':>8}   ({workers} workers)")
+    print("-" * 48)
+    for grid_size, pairs, walls in puzzles:
+        start_time = time.perf_counter()
+        ZipSolver(grid_size, pairs, walls).solve()
+        single = time.perf_counter() - start_time
+        if single < min_seconds:
+            continue
+
+        portfolio = solve_portfolio(grid_size, pairs, walls, workers=workers).elapsed
+        split = solve_portfolio(grid_size, pairs, walls, workers=workers, split_depth=split_depth).elapsed
+        board = f"{grid_size[0]}x{grid_size[1]}"
+        print(f"{board:<8} {single:>7.2f}s {portfolio:>9.2f}s {split:>7.2f}s")
+
+def bench_dead_cache(puzzles: List[Puzzle], sizes: Tuple[int, ...] = (0, 10_000, 200_000)):
+    """Report nodes, time, hit rate and memory of the dead-state cache at several capacities."""
+    print(f"{'Cache size':>10} {'Nodes':>9} {'Time':>8} {'Hit rate':>9} {'Memory':>9}")
+    print("-" * 49)
+    for cache_size in sizes:
+        total_nodes = hits = lookups = memory = 0
+        start_time = time.perf_counter()
+        for grid_size, pairs, walls in puzzles:
+            solver = ZipSolver(grid_size, pairs, walls, dead_cache_size=cache_size)
+            solver.solve()
+            total_nodes += solver.nodes_expanded
+            stats = solver.dead_cache_stats()
+            hits += stats.get("hits", 0)
+            lookups += stats.get("lookups", 0)
+            memory = max(memory, stats.get("bytes", 0))
+        elapsed = time.perf_counter() - start_time
+        hit_rate = hits / lookups if lookups else 0.0
+        print(f"{cache_size:>10} {total_nodes:>9} {elapsed:>7.2f}s {hit_rate:>8.1%} {memory / 1e6:>7.1f}MB")
+
+def bench_ocr(directory: str):
+    """
+    Accuracy and latency of the template recognizer vs Tesseract on labelled screenshots
+    (board.png + board.json, see recognizer.load_board_labels). The recognizer is scored
+    leave-one-out: templates come from every other board in the directory.
+    """
+    import cv2
+    from vision import ZipVision
+    from recognizer import DigitRecognizer, load_board_labels
+
+    boards = []
+    for name in sorted(os.listdir(directory)):
+        labels_path = os.path.join(directory, os.path.splitext(name)[0] + ".json")
+        if name.lower().endswith(".png") and os.path.exists(labels_path):
+            img = cv2.imread(os.path.join(directory, name))
+            grid_size, numbers = load_board_labels(labels_path)
+            vision = ZipVision()
+            vision.board_area = (0, 0, img.shape[1], img.shape[0])
+            vision.detect_grid_structure(img, expected_size=grid_size)
+            boards.append((name, img, vision, numbers))
+
+    print(f"{'Board':<24} {'Templates':>10} {'':>9} {'Tesseract':>10} {'':>9}")
+    print("-" * 66)
+    for name, img, vision, numbers in boards:
+        recognizer = DigitRecognizer()
+        for other_name, other_img, other_vision, other_numbers in boards:
+            if other_name != name:
+                recognizer.learn_from_board(other_img, other_vision, other_numbers)
+
+        row = f"{name:<24}"
+        for method in (recognizer, None):
+            start_time = time.perf_counter()
+            found = vision.detect_numbers_at_cells(img, method)
+            elapsed = time.perf_counter() - start_time
+            correct = sum(found.get(cell) == numbers.get(cell) for cell in vision.cell_positions)
+            accuracy = correct / len(vision.cell_positions)
+            row += f" {accuracy:>9.1%} {elapsed * 1000:>7.1f}ms"
+        print(row)
+
+def bench_capture(bbox: Tuple[int, int, int, int] = (0, 0, 600, 600), repeats: int = 50):
+    """Milliseconds per board-sized capture for each screen backend, BGR and grayscale."""
+    from capture import PILCapture, MSSCapture
+
+    print(f"{'Backend':<10} {'BGR':>9} {'Gray':>9}")
+    print("-" * 30)
+    for backend in (PILCapture, MSSCapture):
+        try:
+            capture = backend()
+            capture.grab(bbox)
+        except Exception as e:
+            print(f"{backend.name:<10} unavailable: {e}")
+            continue
+
+        row = f"{backend.name:<10}"
+        for gray in (False, True):
+            start_time = time.perf_counter()
+            for _ in range(repeats):
+                capture.grab(bbox, gray=gray)
+            row += f" {(time.perf_counter() - start_time) / repeats * 1000:>7.2f}ms"
+        print(row)
+        capture.close()
+
+def bench_drawing(puzzles: List[Puzzle], cell_size: int = 60):
+    """
+    Draw time and input events per drawing mode, with the recording input backend so it
+    runs without a display. Jitter is the worst gap between streamed moves minus step_interval.
+    """
+    from automation import ZipAutomation
+    from input_backend import RecordingInput
+
+    print(f"{'Mode':<10} {'Draw':>9} {'Events':>8} {'Jitter':>9}")
+    print("-" * 40)
+    for mode in ("cells", "turns"):
+        times, events, jitter = [], [], []
+        for grid_size, pairs, walls in puzzles:
+            solver = ZipSolver(grid_size, pairs, walls)
+            path = solver.solve().path
+            positions = {(row, col): (col * cell_size, row * cell_size)
+                         for row in range(grid_size[0]) for col in range(grid_size[1])}
+
+            recorder = RecordingInput()
+            automation = ZipAutomation(positions, mode=mode, input_backend=recorder)
+            with contextlib.redirect_stdout(io.StringIO()):
+                report = automation.draw_path(path, countdown=0)
+            times.append(report.elapsed)
+            events.append(report.events)
+
+            moves = [timestamp for timestamp, kind, _, _ in recorder.events if kind == "move"][1:]
+            jitter.append(max(b - a for a, b in zip(moves, moves[1:])) - automation.step_interval)
+
+        row = f"{mode:<10} {statistics.mean(times) * 1000:>7.0f}ms {statistics.mean(events):>8.0f}"
+        row += f" {max(jitter) * 1000:>7.2f}ms" if mode == "turns" else f" {'':>9}"
+        print(row)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "ocr":
+        bench_ocr(sys.argv[2])
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "capture":
+        bench_capture()
+        sys.exit(0)
+
+    print("Nodes per second")
+    bench_nodes_per_second(puzzle_set())
+    #Without pruning the per-edge work of the inner loop dominates
+    bench_nodes_per_second(puzzle_set(sizes=(5, 6)), pruning=())
+
+    print("\nMove ordering")
+    bench_orderings(puzzle_set(sizes=(6, 7, 8), per_size=20))
+
+    print("\nSearch strategy (8x8, 12 numbered nodes)")
+    bench_strategies([random_puzzle(8, 8, 12, 8, seed) for seed in range(20)])
+
+    print("\nDFS vs CP-SAT by board size")
+    bench_backends()
+
+    print("\nDead-state cache")
+    bench_dead_cache(puzzle_set(sizes=(7, 8), per_size=20))
+
+    print("\nDrawing modes (7x7, recorded input)")
+    bench_drawing(puzzle_set(sizes=(7,), per_size=2))
+
+    print("\nPortfolio solving")
+    bench_portfolio(puzzle_set(sizes=(7, 8), per_size=20), workers=os.cpu_count() or 1)
@@ -0,0 +1,64 @@
+"""
+Saved calibration: everything the setup steps find out, so the next launch only needs one
+capture to confirm the board is still where it was.
+"""
+import json
+import os
+from dataclasses import dataclass, asdict, fields
+from typing import Tuple, List, Dict, Optional
+from recognizer import DEFAULT_TEMPLATES
+
+DEFAULT_PROFILE = "zip_profile.json"
+
+#What calibrating finds out, everything else in a profile is a setting
+CALIBRATION_FIELDS = ("board_area", "grid_size", "row_bounds", "col_bounds", "cell_positions")
+
+@dataclass
+class CalibrationProfile:
+    board_area: Tuple[int, int, int, int]                   # (x, y, width, height) on screen
+    grid_size: Tuple[int, int]                              # (rows, cols)
+    row_bounds: List[float]                                 # Grid lines in board image pixels
+    col_bounds: List[float]
+    cell_positions: Dict[Tuple[int, int], Tuple[int, int]]  # (row, col) -> (screen_x, screen_y)
+    templates_path: str = DEFAULT_TEMPLATES                 # Digit templates for the recognizer
+    move_duration: float = 0.05                             # ZipAutomation.draw_path timings
+    pause_at_cell: float = 0.1
+    draw_mode: str = "cells"                                # ZipAutomation drawing mode, see DRAW_MODES
+    step_interval: float = 0.01                             # Seconds between moves in "turns" mode
+    input_backend: str = "pyautogui"                        # Mouse input backend, see INPUT_BACKENDS
+    verify_drawing: bool = True                             # Check the drawn path and redraw missed cells
+
+    @classmethod
+    def from_vision(cls, vision, **settings) -> "CalibrationProfile":
+        """Profile of a ZipVision with the board area and grid detected, settings fill in the rest."""
+        return cls(board_area=tuple(vision.board_area), grid_size=tuple(vision.grid_size),
+                   row_bounds=list(vision.row_bounds), col_bounds=list(vision.col_bounds),
+                   cell_positions=dict(vision.cell_positions), **settings)
+
+    def settings(self) -> Dict:
+        """The profile's settings without the calibration, to carry over when recalibrating."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name not in CALIBRATION_FIELDS}
+
+    def save(self, path: str = DEFAULT_PROFILE):
+        data = asdict(self)
+        # JSON keys must be strings, store cell positions as [row, col, x, y]
+        data["cell_positions"] = [[row, col, x, y] for (row, col), (x, y) in self.cell_positions.items()]
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        print(f"✓ Calibration saved to {path}")
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PROFILE) -> Optional["CalibrationProfile"]:
+        """The saved profile, or None if there isn't a usable one."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            data["board_area"] = tuple(data["board_area"])
+            data["grid_size"] = tuple(data["grid_size"])
+            data["cell_positions"] = {(row, col): (x, y) for row, col, x, y in data["cell_positions"]}
+            return cls(**data)
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"⚠ Ignoring calibration in {path}: {e}")
+            return None
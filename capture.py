@@ -0,0 +1,125 @@
+"""
+Screen capture backends for the vision pipeline.
+Every backend returns BGR or grayscale frames of a screen region, so ZipVision doesn't
+care where the pixels come from: PIL (the original), mss, or a saved screenshot.
+"""
+import cv2
+import numpy as np
+from PIL import ImageGrab
+from typing import Tuple, Optional, Union
+
+CAPTURE_BACKENDS = ("auto", "pil", "mss", "file")
+
+class ScreenCapture:
+    """A source of screen frames."""
+    name = ""
+
+    def grab(self, bbox: Optional[Tuple[int, int, int, int]] = None, gray: bool = False) -> np.ndarray:
+        """
+        Capture a region of the screen.
+
+        Args:
+            bbox: (x, y, width, height) region, the whole (primary) screen if None
+            gray: Return a single channel grayscale frame instead of BGR
+
+        Returns:
+            OpenCV image of the region
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class PILCapture(ScreenCapture):
+    """PIL.ImageGrab, works everywhere PIL does but is the slowest."""
+    name = "pil"
+
+    def grab(self, bbox: Optional[Tuple[int, int, int, int]] = None, gray: bool = False) -> np.ndarray:
+        if bbox is not None:
+            x, y, width, height = bbox
+            bbox = (x, y, x + width, y + height)
+        pixels = np.asarray(ImageGrab.grab(bbox=bbox))
+
+        # Some platforms give RGBA
+        if pixels.shape[2] == 4:
+            return cv2.cvtColor(pixels, cv2.COLOR_RGBA2GRAY if gray else cv2.COLOR_RGBA2BGR)
+        return cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY if gray else cv2.COLOR_RGB2BGR)
+
+class MSSCapture(ScreenCapture):
+    """
+    mss, with one grabber kept open across captures (opening it is the slow part).
+    The grabber belongs to the thread that created it, make one capture per thread.
+    """
+    name = "mss"
+
+    def __init__(self):
+        import mss
+        self.grabber = mss.mss()
+
+    def grab(self, bbox: Optional[Tuple[int, int, int, int]] = None, gray: bool = False) -> np.ndarray:
+        if bbox is None:
+            region = self.grabber.monitors[1]
+        else:
+            x, y, width, height = bbox
+            region = {"left": x, "top": y, "width": width, "height": height}
+        shot = self.grabber.grab(region)
+
+        # View the raw BGRA buffer in place and convert straight out of it
+        pixels = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return cv2.cvtColor(pixels, cv2.COLOR_BGRA2GRAY if gray else cv2.COLOR_BGRA2BGR)
+
+    def close(self):
+        self.grabber.close()
+
+class ImageCapture(ScreenCapture):
+    """A screenshot standing in for the screen, for testing and replaying saved boards."""
+    name = "file"
+
+    def __init__(self, source: Union[str, np.ndarray]):
+        """
+        Args:
+            source: Path of an image file, or a BGR/grayscale array
+        """
+        if isinstance(source, str):
+            screen = cv2.imread(source)
+            if screen is None:
+                raise ValueError(f"Couldn't read image {source}")
+        else:
+            screen = source
+
+        if screen.ndim == 2:
+            self.gray, self.screen = screen, cv2.cvtColor(screen, cv2.COLOR_GRAY2BGR)
+        else:
+            self.gray, self.screen = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY), screen
+
+    def grab(self, bbox: Optional[Tuple[int, int, int, int]] = None, gray: bool = False) -> np.ndarray:
+        frame = self.gray if gray else self.screen
+        if bbox is not None:
+            x, y, width, height = bbox
+            frame = frame[y:y + height, x:x + width]
+        return frame.copy()
+
+def make_capture(backend: str = "auto", source: Union[str, np.ndarray, None] = None) -> ScreenCapture:
+    """
+    Create a capture backend by name, one of CAPTURE_BACKENDS.
+    "auto" uses mss when it's installed and PIL otherwise. "file" needs a source.
+    """
+    if backend not in CAPTURE_BACKENDS:
+        raise ValueError(f"Unknown capture backend '{backend}', expected one of {CAPTURE_BACKENDS}")
+
+    if backend == "file":
+        if source is None:
+            raise ValueError("The file capture backend needs an image path or array")
+        return ImageCapture(source)
+
+    if backend in ("auto", "mss"):
+        try:
+            return MSSCapture()
+        except ImportError:
+            if backend == "mss":
+                print("⚠ mss not installed, using PIL capture. Install it with: pip install mss")
+        except Exception as e:
+            # No display to open, PIL may still manage
+            if backend == "mss":
+                print(f"⚠ mss capture unavailable ({e}), using PIL capture")
+    return PILCapture()
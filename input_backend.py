@@ -0,0 +1,145 @@
+"""
+Mouse input backends for drawing solutions.
+ZipAutomation only needs to move the pointer and press/release the left button, so the same
+drawing code runs on pyautogui (the original), XTest on Linux, or a recorder for headless tests.
+"""
+import time
+from typing import List, Tuple, Optional
+
+INPUT_BACKENDS = ("pyautogui", "xtest", "record")
+
+class InputBackend:
+    """Sends mouse events. Events may be queued until flush()."""
+    name = ""
+    abort_exceptions: Tuple[type, ...] = ()     # Raised when the user aborts (pyautogui failsafe)
+
+    def move(self, x: int, y: int, duration: float = 0.0):
+        """Move the pointer to (x, y), taking duration seconds to get there."""
+        raise NotImplementedError
+
+    def press(self):
+        """Press the left button."""
+        raise NotImplementedError
+
+    def release(self):
+        """Release the left button."""
+        raise NotImplementedError
+
+    def flush(self):
+        """Send any queued events now."""
+        pass
+
+class PyAutoGUIInput(InputBackend):
+    """pyautogui, with its failsafe: move the mouse to a corner to abort."""
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self.pyautogui = pyautogui
+        self.abort_exceptions = (pyautogui.FailSafeException,)
+
+        #Safety: Allows user to move mouse to corner to stop
+        pyautogui.FAILSAFE = True
+
+        #Allows reasonable speed, can be adjusted
+        pyautogui.PAUSE = 0.01 #10ms between actions
+
+    def move(self, x: int, y: int, duration: float = 0.0):
+        # pyautogui's own pause only applies to moves that take time, streamed moves bring their own timing
+        self.pyautogui.moveTo(x, y, duration=duration, _pause=duration > 0)
+
+    def press(self):
+        self.pyautogui.mouseDown(button='left', _pause=False)
+
+    def release(self):
+        self.pyautogui.mouseUp(button='left', _pause=False)
+
+class XTestInput(InputBackend):
+    """
+    XTest fake input through python-xlib (Linux, X11). Events are queued in the X
+    connection's buffer and written out together on flush(), without waiting for the
+    server to reply, and there is no per-call pause.
+    There is no failsafe, stop it with Ctrl+C.
+    """
+    name = "xtest"
+
+    def __init__(self):
+        from Xlib import X, display
+        from Xlib.ext import xtest
+        self.X = X
+        self.xtest = xtest
+        self.display = display.Display()
+        if not self.display.has_extension("XTEST"):
+            raise RuntimeError("X server has no XTEST extension")
+
+    def move(self, x: int, y: int, duration: float = 0.0):
+        if duration > 0:
+            self.flush()
+            time.sleep(duration)
+        self.xtest.fake_input(self.display, self.X.MotionNotify, x=int(x), y=int(y))
+
+    def press(self):
+        self.xtest.fake_input(self.display, self.X.ButtonPress, 1)
+
+    def release(self):
+        self.xtest.fake_input(self.display, self.X.ButtonRelease, 1)
+
+    def flush(self):
+        self.display.flush()
+
+class RecordingInput(InputBackend):
+    """
+    Stand-in that records timestamped events instead of moving anything, so drawing can be
+    tested and benchmarked without a display.
+    """
+    name = "record"
+
+    def __init__(self):
+        self.events: List[Tuple[float, str, Optional[int], Optional[int]]] = []    # (time, kind, x, y)
+        self.position = (0, 0)
+        self.pressed = False
+
+    def move(self, x: int, y: int, duration: float = 0.0):
+        if duration > 0:
+            time.sleep(duration)
+        self.position = (x, y)
+        self.events.append((time.perf_counter(), "move", x, y))
+
+    def press(self):
+        self.pressed = True
+        self.events.append((time.perf_counter(), "press", *self.position))
+
+    def release(self):
+        self.pressed = False
+        self.events.append((time.perf_counter(), "release", *self.position))
+
+    def drag_positions(self) -> List[Tuple[int, int]]:
+        """Every position the pointer was at with the button held, in order."""
+        positions = []
+        pressed = False
+        for _, kind, x, y in self.events:
+            if kind == "press":
+                pressed = True
+                positions.append((x, y))
+            elif kind == "release":
+                pressed = False
+            elif pressed:
+                positions.append((x, y))
+        return positions
+
+def make_input(backend: str = "pyautogui") -> InputBackend:
+    """Create an input backend by name, one of INPUT_BACKENDS."""
+    if backend == "pyautogui":
+        return PyAutoGUIInput()
+    if backend == "xtest":
+        try:
+            return XTestInput()
+        except ImportError:
+            print("⚠ python-xlib not installed, using pyautogui. Install it with: pip install python-xlib")
+        except Exception as e:
+            # No $DISPLAY, or an X server without XTEST
+            print(f"⚠ XTest input unavailable ({e}), using pyautogui")
+        return PyAutoGUIInput()
+    if backend == "record":
+        return RecordingInput()
+    raise ValueError(f"Unknown input backend '{backend}', expected one of {INPUT_BACKENDS}")
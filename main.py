@@ -1,13 +1,21 @@
 """
 LinkedIn Zip Auto-Solver
 Main integration file that connects vision, solver, and automation
+Run with: py main.py [--chrome-trace]
 """
 print ("Starting it up")
 from vision import ZipVision
-from solver import ZipSolver
-from automation import ZipAutomation
-import time
+from solver import ZipSolver, SolveStatus
+from automation import ZipAutomation, DRAW_MODES
+from recognizer import DigitRecognizer
+from solution_cache import SolutionCache
+from calibration import CalibrationProfile, DEFAULT_PROFILE
+from tracing import tracer, DEFAULT_TRACE, DEFAULT_CHROME_TRACE
+import sys
 print("IMports done")
+
+SOLVE_TIMEOUT = 30.0    # Seconds before the solver gives up
+GRID_CONFIDENCE = 0.8   # Below this the detected grid size is confirmed by hand
 def main():
     print("=" * 70)
     print("LINKEDIN ZIP AUTO-SOLVER")
@@ -27,20 +35,47 @@ def main():
     
     vision = ZipVision()
     
-    # Select board area
-    vision.select_board_area()
-    
-    # Capture screenshot
-    print("\nCapturing board...")
-    img = vision.capture_board()
-    print("✓ Board captured")
-    
-    # Get grid size
-    print("\nEnter grid dimensions:")
-    rows = int(input("  Rows: "))
-    cols = int(input("  Cols: "))
-    
-    vision.detect_grid_structure(img, expected_size=(rows, cols))
+    # A saved calibration only needs one capture to confirm it still fits
+    profile = CalibrationProfile.load(DEFAULT_PROFILE)
+    saved = profile
+    calibrated = profile is None
+    if profile:
+        vision.apply_profile(profile)
+        img = vision.capture_board()
+        if vision.grid_matches(img):
+            rows, cols = vision.grid_size
+            print(f"✓ Using saved calibration: {rows}x{cols} grid at {vision.board_area}")
+        else:
+            print("⚠ Saved calibration doesn't match the screen, calibrating again")
+            profile = None
+
+    if not profile:
+        # Find the board on screen, select it by hand if that fails
+        print("\nLocating board...")
+        if not vision.locate_board():
+            vision.select_board_area()
+        
+        # Capture screenshot
+        print("\nCapturing board...")
+        img = vision.capture_board()
+        print("✓ Board captured")
+        
+        # Get grid size
+        print("\nDetecting grid...")
+        confidence = vision.detect_grid_structure(img)
+        if confidence >= GRID_CONFIDENCE:
+            rows, cols = vision.grid_size
+        else:
+            print("⚠ Not sure about the detected grid")
+            print("\nEnter grid dimensions:")
+            rows = int(input("  Rows: "))
+            cols = int(input("  Cols: "))
+            
+            vision.detect_grid_structure(img, expected_size=(rows, cols))
+
+        # Keep the saved settings (templates, drawing, input backend) when recalibrating
+        profile = CalibrationProfile.from_vision(vision, **(saved.settings() if saved else {}))
+        profile.save(DEFAULT_PROFILE)
     
     # ========================================================================
     # STEP 2: NUMBER DETECTION
@@ -48,13 +83,19 @@ def main():
     print("\n[STEP 2] NUMBER DETECTION")
     print("-" * 70)
     
+    recognizer = DigitRecognizer(profile.templates_path)
+    typed_numbers = True
+
     print("\nType y if you want to try OCR detection first:")
     try_ocr = input("  Try OCR? (y/n): ").lower() == 'y'
     
     if try_ocr:
         print("\nAttempting OCR detection...")
-        print("(This requires pytesseract and Tesseract-OCR installed)")
-        numbers = vision.detect_numbers_at_cells(img)
+        if recognizer.has_templates():
+            print("(Using learned digit templates)")
+        else:
+            print("(This requires pytesseract and Tesseract-OCR installed)")
+        numbers = vision.detect_numbers_at_cells(img, recognizer)
         
         if not numbers or len(numbers) < 2:
             print("OCR detection failed or found too few numbers")
@@ -69,6 +110,7 @@ def main():
                         numbers[(row, col)] = int(num_input)
         else:
             print(f"OCR detected {len(numbers)} numbers successfully")
+            typed_numbers = False
     else:
         print("\nManual input mode")    
         numbers = {}
@@ -81,6 +123,11 @@ def main():
     print(f"\nDetected {len(numbers)} numbered cells:")
     for cell, num in sorted(numbers.items(), key=lambda x: x[1]):
         print(f"  {num} at {cell}")
+
+    # Typed-in numbers are labels, learn templates from them for next time
+    if typed_numbers and numbers:
+        if recognizer.learn_from_board(img, vision, numbers):
+            recognizer.save(profile.templates_path)
     
     # Create pairs from consecutive numbers
     print("\nCreating pairs from consecutive numbers...")
@@ -160,14 +207,18 @@ def main():
     
     # Create solver and solve
     print(f"\nSolving {rows}x{cols} grid with {len(pairs)} pairs...")
-    solver = ZipSolver((rows, cols), pairs, walls if walls else None)
+    solver = ZipSolver((rows, cols), pairs, walls if walls else None, solution_cache=SolutionCache())
     
-    print("This may take a moment...")
-    start_time = time.time()
-    solution_found = solver.solve()
-    solve_time = time.time() - start_time
+    print(f"This may take a moment (giving up after {SOLVE_TIMEOUT:.0f}s)...")
+    result = solver.solve(timeout=SOLVE_TIMEOUT)
+    solve_time = result.elapsed
     
-    if not solution_found:
+    if result.status == SolveStatus.BUDGET_EXHAUSTED:
+        print(f"\n✗ Gave up after {solve_time:.2f}s ({result.nodes_expanded} nodes expanded)")
+        print(f"  Deepest partial path covered {len(result.deepest_path)}/{rows * cols} cells")
+        return
+
+    if not result:
         print(f"\n✗ No solution found (took {solve_time:.2f}s)")
         print("\nPossible reasons:")
         print("  - Incorrect grid size")
@@ -176,7 +227,12 @@ def main():
         print("  - Puzzle is actually unsolvable")
         return
     
-    print(f"\n✓ Solution found in {solve_time:.2f}s!")
+    if result.cached:
+        print(f"\n✓ Board solved before, solution loaded from cache in {solve_time * 1000:.2f}ms!")
+    else:
+        print(f"\n✓ Solution found in {solve_time:.2f}s ({result.nodes_expanded} nodes expanded)!")
+    for name, count in solver.prune_counts.items():
+        print(f"  Pruned by {name}: {count} branches")
     solver.print_solution()
     solver.visualize_solution()
 
@@ -197,16 +253,23 @@ def main():
         print("Automation skipped. Exiting.")
         return
     
-    # Settings
-    print("\nAutomation settings:")
-    drag_speed = input("  Drag speed (0.01=fast, 0.1=slow) [default: 0.05]: ").strip()
-    drag_speed = float(drag_speed) if drag_speed else 0.05
-    
-    pause_time = input("  Pause at each cell (seconds) [default: 0.1]: ").strip()
-    pause_time = float(pause_time) if pause_time else 0.1
+    # Settings, asked when calibrating and then kept in the profile
+    if calibrated:
+        print("\nAutomation settings:")
+        drag_speed = input(f"  Drag speed (0.01=fast, 0.1=slow) [default: {profile.move_duration}]: ").strip()
+        pause_time = input(f"  Pause at each cell (seconds) [default: {profile.pause_at_cell}]: ").strip()
+        draw_mode = input(f"  Drawing mode, cells or turns (one fast drag per straight run) "
+                          f"[default: {profile.draw_mode}]: ").strip().lower()
+        profile.move_duration = float(drag_speed) if drag_speed else profile.move_duration
+        profile.pause_at_cell = float(pause_time) if pause_time else profile.pause_at_cell
+        profile.draw_mode = draw_mode if draw_mode in DRAW_MODES else profile.draw_mode
+        profile.save(DEFAULT_PROFILE)
+    else:
+        print(f"\nUsing saved settings: {profile.draw_mode} mode, drag {profile.move_duration}s, "
+              f"pause {profile.pause_at_cell}s (delete {DEFAULT_PROFILE} to change them)")
     
     # Create automation and draw
-    automation = ZipAutomation(vision.cell_positions)
+    automation = ZipAutomation.from_profile(profile)
     
     print("\n⚠ IMPORTANT:")
     print("  - Make sure the game is visible and in focus")
@@ -216,11 +279,14 @@ def main():
     ready = input("\nReady to start? (yes to proceed): ").lower()
     
     if ready == 'yes':
-        automation.draw_path(
-            solver.solution_path,
-            move_duration=drag_speed,
-            pause_at_cell=pause_time
-        )
+        if profile.verify_drawing:
+            automation.draw_and_verify(solver.solution_path, vision)
+
+            # Keep the adapted speed for next time
+            profile.step_interval, profile.pause_at_cell = automation.step_interval, automation.pause_at_cell
+            profile.save(DEFAULT_PROFILE)
+        else:
+            automation.draw_path(solver.solution_path)
         print("\n🎉 Puzzle solved automatically!")
     else:
         print("Automation cancelled.")
@@ -230,6 +296,7 @@ def main():
     print("=" * 70)
 
 if __name__ == "__main__":
+    tracer.enable()
     try:
         main()
     except KeyboardInterrupt:
@@ -237,4 +304,10 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n\n✗ Error occurred: {e}")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
+    finally:
+        # Where the time went, stage by stage (prompts aren't counted)
+        tracer.print_summary()
+        tracer.save(DEFAULT_TRACE)
+        if "--chrome-trace" in sys.argv:
+            tracer.save_chrome(DEFAULT_CHROME_TRACE)
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+In-process number recognition for Zip boards.
+Nearest-neighbour matching of binarized glyphs against templates learned from labelled boards,
+so reading a board is one NumPy matrix product instead of a Tesseract process per cell.
+"""
+import cv2
+import numpy as np
+import json
+import os
+import sys
+from typing import Tuple, List, Dict, Optional
+
+GLYPH_SIZE = 20             # Glyphs are normalized to GLYPH_SIZE x GLYPH_SIZE before matching
+DEFAULT_TEMPLATES = "digit_templates.npz"
+
+def load_board_labels(json_path: str) -> Tuple[Tuple[int, int], Dict[Tuple[int, int], int]]:
+    """
+    Read the labels for a board screenshot.
+    Format: {"rows": 7, "cols": 7, "numbers": [[row, col, number], ...]}
+
+    Returns:
+        ((rows, cols), {(row, col): number})
+    """
+    with open(json_path) as f:
+        data = json.load(f)
+    numbers = {(row, col): number for row, col, number in data["numbers"]}
+    return (data["rows"], data["cols"]), numbers
+
+def glyph_ink(binary: np.ndarray) -> np.ndarray:
+    """
+    The number's ink in a thresholded cell crop (ink = 255), cropped to its bounding box.
+    Numbers drawn light on a dark badge are read from the holes in the badge.
+    Empty if the crop has no ink.
+    """
+    ys, xs = np.nonzero(binary)
+    if len(ys) == 0:
+        return binary[:0, :0]
+
+    ink = binary[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+    if ink.mean() > 127:
+        # Mostly filled: keep the holes that don't touch the edge, those are the number
+        holes = cv2.bitwise_not(ink)
+        _, labels = cv2.connectedComponents(holes)
+        edge_labels = np.unique(np.concatenate([labels[0], labels[-1], labels[:, 0], labels[:, -1]]))
+        holes[np.isin(labels, edge_labels)] = 0
+        ys, xs = np.nonzero(holes)
+        if len(ys) > 0:
+            ink = holes[ys.min():ys.max() + 1, xs.min():xs.max() + 1]
+    return ink
+
+class DigitRecognizer:
+    def __init__(self, templates_path: Optional[str] = None, min_score: float = 0.85):
+        """
+        Args:
+            templates_path: .npz file of learned templates to load, if it exists
+            min_score: Cosine similarity a glyph needs with its best template to be accepted
+        """
+        self.templates = np.zeros((0, GLYPH_SIZE * GLYPH_SIZE), dtype=np.float32)
+        self.labels = np.zeros(0, dtype=np.int32)
+        self.min_score = min_score
+
+        if templates_path and os.path.exists(templates_path):
+            self.load(templates_path)
+
+    def has_templates(self) -> bool:
+        return len(self.labels) > 0
+
+    @staticmethod
+    def normalize_glyph(binary: np.ndarray) -> np.ndarray:
+        """
+        Turn a thresholded cell crop (ink = 255) into a unit-length feature vector:
+        take the number's ink (see glyph_ink), pad to a square, resize to GLYPH_SIZE.
+        Cells without ink give a zero vector.
+        """
+        ink = glyph_ink(binary)
+        if ink.size == 0:
+            return np.zeros(GLYPH_SIZE * GLYPH_SIZE, dtype=np.float32)
+
+        height, width = ink.shape
+        side = max(height, width)
+        square = np.zeros((side, side), dtype=np.uint8)
+        top, left = (side - height) // 2, (side - width) // 2
+        square[top:top + height, left:left + width] = ink
+
+        glyph = cv2.resize(square, (GLYPH_SIZE, GLYPH_SIZE), interpolation=cv2.INTER_AREA)
+        glyph = glyph.astype(np.float32).ravel()
+        return glyph / np.linalg.norm(glyph)
+
+    def add_templates(self, glyphs: np.ndarray, labels: List[int]):
+        """Add normalized glyphs (n, GLYPH_SIZE**2) with their numbers as templates."""
+        self.templates = np.vstack([self.templates, glyphs.astype(np.float32)])
+        self.labels = np.concatenate([self.labels, np.asarray(labels, dtype=np.int32)])
+
+    def learn_from_board(self, img: np.ndarray, vision, numbers: Dict[Tuple[int, int], int]) -> int:
+        """
+        Learn templates from a board whose numbers are known (OCR confirmed or typed in).
+        Only numbers the current templates misread or can't read are added, so boards that
+        are already read correctly don't grow the templates (or slow down classify()).
+
+        Args:
+            img: Board image the vision grid was detected on
+            vision: ZipVision with the grid structure detected
+            numbers: Dict of (row, col) -> number for that board
+
+        Returns:
+            Number of templates added
+        """
+        crops = vision.cell_crops(img)
+        cells = [cell for cell in numbers if cell in crops]
+        if not cells:
+            return 0
+        glyphs = np.stack([self.normalize_glyph(crops[cell]) for cell in cells])
+        labels = [numbers[cell] for cell in cells]
+        missed = [index for index, read in enumerate(self.classify(glyphs)) if read != labels[index]]
+        if missed:
+            self.add_templates(glyphs[missed], [labels[index] for index in missed])
+        return len(missed)
+
+    def classify(self, glyphs: np.ndarray) -> List[Optional[int]]:
+        """
+        Classify a batch of normalized glyphs (n, GLYPH_SIZE**2) in one matrix product.
+
+        Returns:
+            The number for each glyph, or None if nothing matched well enough
+        """
+        if not self.has_templates() or len(glyphs) == 0:
+            return [None] * len(glyphs)
+
+        scores = glyphs @ self.templates.T             # Cosine similarity, all vectors are unit length
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(glyphs)), best]
+        return [int(self.labels[index]) if score >= self.min_score else None
+                for index, score in zip(best, best_scores)]
+
+    def save(self, path: str = DEFAULT_TEMPLATES):
+        np.savez_compressed(path, templates=self.templates, labels=self.labels)
+        print(f"✓ Saved {len(self.labels)} digit templates to {path}")
+
+    def load(self, path: str = DEFAULT_TEMPLATES):
+        data = np.load(path)
+        self.templates = data["templates"].astype(np.float32)
+        self.labels = data["labels"].astype(np.int32)
+        print(f"✓ Loaded {len(self.labels)} digit templates from {path}")
+
+def learn_from_directory(directory: str, templates_path: str = DEFAULT_TEMPLATES) -> DigitRecognizer:
+    """
+    Build templates from labelled screenshots: every board.png next to a board.json
+    (see load_board_labels) in the directory.
+    """
+    from vision import ZipVision
+
+    recognizer = DigitRecognizer()
+    for name in sorted(os.listdir(directory)):
+        if not name.lower().endswith(".png"):
+            continue
+        labels_path = os.path.join(directory, os.path.splitext(name)[0] + ".json")
+        if not os.path.exists(labels_path):
+            print(f"⚠ No labels for {name}, skipping")
+            continue
+
+        img = cv2.imread(os.path.join(directory, name))
+        grid_size, numbers = load_board_labels(labels_path)
+        vision = ZipVision()
+        vision.board_area = (0, 0, img.shape[1], img.shape[0])
+        vision.detect_grid_structure(img, expected_size=grid_size)
+        added = recognizer.learn_from_board(img, vision, numbers)
+        print(f"  {name}: {added} templates")
+
+    recognizer.save(templates_path)
+    return recognizer
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: py recognizer.py <directory of labelled screenshots> [templates.npz]")
+        sys.exit(1)
+    learn_from_directory(sys.argv[1], *sys.argv[2:3])
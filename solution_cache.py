@@ -0,0 +1,124 @@
+"""
+On-disk cache of solved boards.
+Boards are keyed by a canonical fingerprint that is the same for all 8 rotations and
+reflections of a board, so a transformed copy of a solved board is a hit too.
+"""
+import json
+import sqlite3
+from typing import Tuple, List, Optional, Iterable
+
+DEFAULT_CACHE = "solutions.sqlite"
+
+Cell = Tuple[int, int]
+
+def transform_cell(cell: Cell, grid_size: Tuple[int, int], transform: int) -> Cell:
+    """
+    Map a cell through one of the 8 symmetries of the square (0 is the identity).
+    Transforms 1, 3, 6 and 7 swap rows and cols, the cell lands on a (cols, rows) grid.
+    """
+    row, col = cell
+    rows, cols = grid_size
+    if transform == 0:
+        return (row, col)
+    if transform == 1:    # Rotate 90 clockwise
+        return (col, rows - 1 - row)
+    if transform == 2:    # Rotate 180
+        return (rows - 1 - row, cols - 1 - col)
+    if transform == 3:    # Rotate 270 clockwise
+        return (cols - 1 - col, row)
+    if transform == 4:    # Mirror left-right
+        return (row, cols - 1 - col)
+    if transform == 5:    # Mirror top-bottom
+        return (rows - 1 - row, col)
+    if transform == 6:    # Transpose
+        return (col, row)
+    if transform == 7:    # Anti-transpose
+        return (cols - 1 - col, rows - 1 - row)
+    raise ValueError(f"Unknown transform {transform}, expected 0-7")
+
+INVERSE_TRANSFORMS = (0, 3, 2, 1, 4, 5, 6, 7)
+
+def transformed_size(grid_size: Tuple[int, int], transform: int) -> Tuple[int, int]:
+    rows, cols = grid_size
+    return (cols, rows) if transform in (1, 3, 6, 7) else (rows, cols)
+
+def board_fingerprint(grid_size: Tuple[int, int], pairs: List[Tuple[Cell, Cell]],
+                      walls: Optional[Iterable[Tuple[Cell, Cell]]] = None) -> Tuple[str, int]:
+    """
+    Canonical fingerprint of a board: the smallest description over all 8 symmetries.
+
+    Returns:
+        (fingerprint, transform) where transform maps this board onto the canonical one
+    """
+    cells = [cell for pair in pairs for cell in pair]
+    # Walls are undirected, a wall given in both directions is counted once
+    wall_list = list({(min(a, b), max(a, b)) for a, b in walls or ()})
+
+    # Every symmetry is affine, so the cell index after it is row * A + col * B + K
+    candidates = []
+    for transform in range(8):
+        size = transformed_size(grid_size, transform)
+        origin = transform_cell((0, 0), grid_size, transform)
+        down = transform_cell((1, 0), grid_size, transform)
+        right = transform_cell((0, 1), grid_size, transform)
+        width = size[1]
+        K = origin[0] * width + origin[1]
+        A = down[0] * width + down[1] - K
+        B = right[0] * width + right[1] - K
+        candidates.append(((size, tuple(row * A + col * B + K for row, col in cells)), transform, A, B, K))
+
+    # The numbered cells almost always decide it, walls only break ties (symmetric boards)
+    head = min(candidate[0] for candidate in candidates)
+    best = None
+    for description, transform, A, B, K in candidates:
+        if description != head:
+            continue
+        moved_walls = tuple(sorted((min(i, j), max(i, j)) for i, j in
+                                   ((a[0] * A + a[1] * B + K, b[0] * A + b[1] * B + K) for a, b in wall_list)))
+        if best is None or moved_walls < best[0]:
+            best = (moved_walls, transform)
+
+    (size, nodes), (moved_walls, transform) = head, best
+    return f"{size[0]}x{size[1]}|{nodes}|{moved_walls}", transform
+
+class SolutionCache:
+    def __init__(self, path: str = DEFAULT_CACHE):
+        """
+        Args:
+            path: SQLite file to keep solutions in, ":memory:" for a cache that isn't saved
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS solutions (fingerprint TEXT PRIMARY KEY, path TEXT)")
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, grid_size: Tuple[int, int], pairs: List[Tuple[Cell, Cell]],
+            walls: Optional[Iterable[Tuple[Cell, Cell]]] = None) -> Optional[List[Cell]]:
+        """The solution path for this board (in its own orientation), or None if it isn't cached."""
+        fingerprint, transform = board_fingerprint(grid_size, pairs, walls)
+        row = self.connection.execute("SELECT path FROM solutions WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        # Stored in the canonical orientation, map it back onto this board
+        canonical_size = transformed_size(grid_size, transform)
+        inverse = INVERSE_TRANSFORMS[transform]
+        return [transform_cell(tuple(cell), canonical_size, inverse) for cell in json.loads(row[0])]
+
+    def put(self, grid_size: Tuple[int, int], pairs: List[Tuple[Cell, Cell]],
+            walls: Optional[Iterable[Tuple[Cell, Cell]]], path: List[Cell]):
+        """Store the solution path of a board."""
+        fingerprint, transform = board_fingerprint(grid_size, pairs, walls)
+        canonical_path = [transform_cell(cell, grid_size, transform) for cell in path]
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?)",
+                                    (fingerprint, json.dumps(canonical_path)))
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
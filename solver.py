@@ -1,22 +1,146 @@
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Sequence, Iterator, Callable
+from collections import OrderedDict
 from copy import deepcopy
+from dataclasses import dataclass, field
+from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from tracing import tracer, traced
+
+#Neighbour order used by get_neighbours: up, down, left, right
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+#Alternative direction orders for portfolio solving
+DIRECTION_ORDERS = (
+    DIRECTIONS,
+    ((0, 1), (0, -1), (1, 0), (-1, 0)),
+    ((1, 0), (0, 1), (-1, 0), (0, -1)),
+    ((0, -1), (-1, 0), (0, 1), (1, 0)),
+)
+
+#Pruning passes the DFS can run, cheapest first
+PRUNING_PASSES = ("dead_ends", "connectivity", "parity")
+
+#Search engines: recursive DFS, the same DFS on an explicit stack that can pause and resume,
+#leg-by-leg search between consecutive numbered nodes, or an OR-Tools CP-SAT model
+STRATEGIES = ("recursive", "iterative", "segments", "cp_sat")
+
+#Move ordering policies: fixed up/down/left/right, fewest onward moves first (Warnsdorff),
+#closest to the next numbered node first, or cells along walls and edges first
+ORDERINGS = ("fixed", "warnsdorff", "waypoint", "wall_hugging")
+
+#How many nodes the DFS expands between deadline/cancellation checks
+CHECK_INTERVAL = 1024
+
+#Default number of nodes between progress callbacks
+PROGRESS_INTERVAL = 100_000
+
+class SolveStatus(Enum):
+    SOLVED = "solved"
+    UNSOLVABLE = "unsolvable"                   # Whole search space exhausted
+    BUDGET_EXHAUSTED = "budget_exhausted"       # Hit the timeout or max_nodes first
+    CANCELLED = "cancelled"                     # Stopped through the cancel token
+
+@dataclass
+class SolveResult:
+    """Outcome of ZipSolver.solve(). Truthy only when a solution was found."""
+    status: SolveStatus
+    nodes_expanded: int
+    elapsed: float                                              # Seconds spent in solve()
+    path: List[Tuple[int, int]] = field(default_factory=list)   # Solution path, empty unless solved
+    deepest_path: List[Tuple[int, int]] = field(default_factory=list)  # Longest partial path reached
+    cached: bool = False                                        # Came from the solution cache, no search
+
+    def __bool__(self) -> bool:
+        return self.status == SolveStatus.SOLVED
+
+@dataclass
+class SearchStats:
+    """
+    Search statistics of a ZipSolver created with collect_stats=True, refreshed for every
+    progress callback and at the end of solve(). Depths count the cells in the partial path.
+    Backtracks and the "out_of_order"/"wrong_end" prunes are counted by the recursive and
+    iterative engines, the segments and CP-SAT engines leave them empty.
+    """
+    nodes_expanded: int = 0
+    elapsed: float = 0.0                                            # Seconds since solve() started
+    depth: int = 0                                                  # Current depth (recursive and iterative engines)
+    max_depth: int = 0                                              # Deepest partial path reached
+    backtracks_per_depth: List[int] = field(default_factory=list)   # [d]: partial paths of d cells abandoned
+    prunes: Dict[str, int] = field(default_factory=dict)            # Branches cut, by reason
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes_expanded / self.elapsed if self.elapsed > 0 else 0.0
+
+class CancelToken:
+    """
+    Thread-safe flag to stop a running solve from elsewhere.
+    Wraps a threading.Event, or any object with set()/is_set() such as a multiprocessing Event.
+    """
+    def __init__(self, event=None):
+        self.event = event if event is not None else threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.event.is_set()
+
+class SearchStopped(Exception):
+    """Raised inside the recursive DFS to unwind it when the budget runs out or it gets cancelled."""
+    def __init__(self, status: SolveStatus):
+        super().__init__(status.value)
+        self.status = status
+
 class ZipSolver:
     #Constructor 
+    @traced("solver.setup")
     def __init__(self, grid_size: Tuple[int, int], pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]], 
-                walls: Optional[set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None):
+                walls: Optional[set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None,
+                pruning: Sequence[str] = PRUNING_PASSES, strategy: str = "recursive",
+                ordering: str = "fixed", directions: Sequence[Tuple[int, int]] = DIRECTIONS,
+                dead_cache_size: int = 0, solution_cache=None, collect_stats: bool = False,
+                progress: Optional[Callable[[SearchStats], None]] = None,
+                progress_interval: int = PROGRESS_INTERVAL):
         """
         Initialize the solver for LinkedIn Zip game.
         
         Args:
             grid_size: (rows, cols) tuple
             pairs: List of ((start_row, start_col), (end_row, end_col)) tuples
-            walls: Set of edges that are blocked. Each edge is ((r1,c1), (r2,c2)), order doesn't matter
+            walls: Set of edges that are blocked. Each edge is ((r1,c1), (r2,c2)), order doesn't matter.
+                   Also accepts the (horizontal, vertical) wall arrays from ZipVision.detect_wall_grid()
+            pruning: Names of the pruning passes to enable, any of PRUNING_PASSES
+            strategy: Search engine to use, one of STRATEGIES
+            ordering: Order to try neighbours in, one of ORDERINGS
+            directions: (dr, dc) steps in the order get_neighbours lists them
+            dead_cache_size: Remember up to this many proven-dead search states (LRU), 0 to disable
+            solution_cache: SolutionCache (see solution_cache.py) to look the board up in before
+                            searching and to store the solution in after
+            collect_stats: Gather SearchStats into self.stats during solve(). The recursive engine
+                           then runs an instrumented copy of the DFS, without it nothing is added
+            progress: Called with the SearchStats every progress_interval nodes, implies collect_stats.
+                      Reports are scheduled with the budget checks, so nothing runs in between
         """
         self.rows, self.cols = grid_size
+        self.directions = tuple(directions)
         self.pairs = pairs
+        self.solution_cache = solution_cache
         self.total_cells = self.rows * self.cols
         self.walls = set()
         
+        # Wall arrays from vision: horizontal[r][c] blocks (r,c)-(r+1,c), vertical[r][c] blocks (r,c)-(r,c+1)
+        if isinstance(walls, tuple) and len(walls) == 2 and getattr(walls[0], "ndim", 0) == 2:
+            horizontal, vertical = walls
+            walls = {((r, c), (r + 1, c)) for r in range(self.rows - 1) for c in range(self.cols) if horizontal[r][c]}
+            walls |= {((r, c), (r, c + 1)) for r in range(self.rows) for c in range(self.cols - 1) if vertical[r][c]}
+
         # Normalize wall edges (make both directions blocked)
         if walls:
             for edge in walls:
@@ -25,6 +149,79 @@ class ZipSolver:
         
         self.nodes = self.extract_nodes()       #Extracts nodes from pairs
         self.solution_path = []                             # To store the final solution path
+        self.nodes_expanded = 0                             # DFS calls made by the last solve
+        self.deepest_path: List[int] = []                   # Longest partial path (cell indices) reached
+
+        #Solve budget, checked every CHECK_INTERVAL nodes
+        self.next_checkpoint = 1 << 62
+        self.deadline: Optional[float] = None
+        self.max_nodes: Optional[int] = None
+        self.cancel_token: Optional[CancelToken] = None
+
+        #Search statistics, None unless collected
+        self.collect_stats = collect_stats or progress is not None
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.next_progress = progress_interval
+        self.stats: Optional[SearchStats] = None
+        self.stats_start = 0.0
+        self.stats_base: Tuple[Dict[str, int], int] = ({}, 0)     # Counters when the solve started
+        self.search_path: List[int] = []                        # Path list of the recursive engine
+
+        #Bitboard search state: cell (r, c) is bit r * cols + c
+        self.full_mask = (1 << self.total_cells) - 1
+        self.node_cells = [self.cell_index(node) for node in self.nodes]
+        self.node_order = self.build_node_order()
+        self.adjacency, self.neighbour_masks = self.build_adjacency()
+        self.move_masks = self.build_move_masks()
+
+        #Pruning passes and how many branches each one cut
+        for name in pruning:
+            if name not in PRUNING_PASSES:
+                raise ValueError(f"Unknown pruning pass '{name}', expected one of {PRUNING_PASSES}")
+        self.pruning = tuple(name for name in PRUNING_PASSES if name in pruning)
+        self.prune_counts: Dict[str, int] = {name: 0 for name in self.pruning}
+        self.node_prunes = [(name, getattr(self, f"prune_{name}")) for name in self.pruning if name != "parity"]
+
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}', expected one of {STRATEGIES}")
+        self.strategy = strategy
+
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Unknown ordering '{ordering}', expected one of {ORDERINGS}")
+        self.ordering = ordering
+        self.order_moves = None         # Set for policies that depend on the search state
+        self.waypoint_distances = [[abs(r - node[0]) + abs(c - node[1]) for r in range(self.rows) for c in range(self.cols)]
+                                   for node in self.nodes]
+        if ordering == "wall_hugging":
+            #Static: fewer open sides means the cell touches a wall or the edge
+            self.adjacency = [sorted(neighbours, key=lambda n: len(self.adjacency[n])) for neighbours in self.adjacency]
+        elif ordering == "warnsdorff":
+            self.order_moves = self.order_warnsdorff
+        elif ordering == "waypoint":
+            self.order_moves = self.order_waypoint
+
+        #Segment engine: (leg, occupied mask) stitch states that failed
+        self.dead_legs: set[Tuple[int, int]] = set()
+        #Minimum moves (Manhattan) needed for legs k, k+1, ... to the final node
+        self.legs_remaining = [0] * max(len(self.nodes), 1)
+        for leg in range(len(self.nodes) - 2, -1, -1):
+            self.legs_remaining[leg] = self.legs_remaining[leg + 1] + self.waypoint_distances[leg + 1][self.node_cells[leg]]
+
+        #Transposition cache: (head, visited) states whose whole subtree failed
+        self.dead_cache_size = dead_cache_size
+        self.dead_states: Optional[OrderedDict] = OrderedDict() if dead_cache_size > 0 else None
+        self.dead_cache_lookups = 0
+        self.dead_cache_hits = 0
+
+        #Explicit stack for the iterative engine, one record per path cell
+        self.stack_cells = [0] * self.total_cells           # Cell at each depth
+        self.stack_moves: List = [None] * self.total_cells   # Iterator over the untried neighbours at each depth
+        self.stack_next_nodes = [0] * self.total_cells      # Next required node index at each depth
+        self.stack_depth = -1
+        self.stack_base = 0                                 # Depth of the last fixed prefix cell
+        self.stack_visited = 0
+        self.search_result: Optional[bool] = None           # Set once the iterative search finishes
     
     def extract_nodes(self) -> list[Tuple[int, int]]:
         """Extract all unique nodes from the pairs."""
@@ -41,6 +238,122 @@ class ZipSolver:
                 raise ValueError("Pairs must be in consecutive order.")
         return nodes
 
+    def build_node_order(self) -> List[int]:
+        """Flat cell -> waypoint order lookup, -1 for cells without a number."""
+        node_order = [-1] * self.total_cells
+        for order, cell in enumerate(self.node_cells):
+            node_order[cell] = order
+        return node_order
+
+    def cell_index(self, pos: Tuple[int, int]) -> int:
+        """Convert a (row, col) position to its bit index on the board."""
+        return pos[0] * self.cols + pos[1]
+
+    def cell_position(self, index: int) -> Tuple[int, int]:
+        """Convert a bit index back to its (row, col) position."""
+        return divmod(index, self.cols)
+
+    def build_adjacency(self) -> Tuple[List[List[int]], List[int]]:
+        """
+        Precompute the wall-free neighbours of every cell once, so the DFS never
+        touches tuples or the wall set.
+
+        Returns:
+            (adjacency, neighbour_masks) where adjacency[i] lists neighbour indices in
+            up/down/left/right order and neighbour_masks[i] has the same cells as bits
+        """
+        adjacency = []
+        neighbour_masks = []
+        for index in range(self.total_cells):
+            neighbours = [self.cell_index(n) for n in self.get_neighbours(self.cell_position(index))]
+            mask = 0
+            for neighbour in neighbours:
+                mask |= 1 << neighbour
+            adjacency.append(neighbours)
+            neighbour_masks.append(mask)
+        return adjacency, neighbour_masks
+
+    def build_move_masks(self) -> Tuple[int, int, int, int]:
+        """
+        Build (up, down, left, right) masks of the cells that can step in each direction,
+        so a whole set of cells can be moved at once with a shift.
+        """
+        up = down = left = right = 0
+        for index, neighbours in enumerate(self.adjacency):
+            bit = 1 << index
+            for neighbour in neighbours:
+                if neighbour == index - self.cols:
+                    up |= bit
+                elif neighbour == index + self.cols:
+                    down |= bit
+                elif neighbour == index - 1:
+                    left |= bit
+                else:
+                    right |= bit
+        return up, down, left, right
+
+    def reachable(self, seed: int, allowed: int) -> int:
+        """Flood fill from the seed bits through the allowed cells, returns the reached mask."""
+        up, down, left, right = self.move_masks
+        cols = self.cols
+        region = seed
+        while True:
+            grown = (region | ((region & up) >> cols) | ((region & down) << cols)
+                     | ((region & left) >> 1) | ((region & right) << 1)) & allowed
+            if grown == region:
+                return region
+            region = grown
+
+    def prune_connectivity(self, current: int, visited: int) -> bool:
+        """Branch is dead if some unvisited cell can no longer be reached from the head."""
+        free = self.full_mask & ~visited
+        head = 1 << current
+        return bool(free & ~self.reachable(head, free | head))
+
+    def prune_dead_ends(self, current: int, visited: int) -> bool:
+        """
+        Branch is dead if an unvisited cell other than the final node has at most one
+        free neighbour (it could only be entered, never left), or if more than one does.
+        """
+        up, down, left, right = self.move_masks
+        cols = self.cols
+        free = self.full_mask & ~visited
+        open_cells = free | (1 << current)
+
+        #For every free cell, which directions lead to an open cell
+        a = up & (open_cells << cols)
+        b = down & (open_cells >> cols)
+        c = left & (open_cells << 1)
+        d = right & (open_cells >> 1)
+        two_or_more = (a & b) | (a & c) | (a & d) | (b & c) | (b & d) | (c & d)
+
+        dead_ends = free & ~two_or_more
+        return bool(dead_ends) and dead_ends != 1 << self.node_cells[-1]
+
+    def prune_parity(self) -> bool:
+        """
+        Checkerboard feasibility: the path alternates colours, so the colour counts and
+        the colour of the final node are fixed by the start node and the board size.
+        Those counts stay consistent along any path, so checking the root once is the
+        same as checking every node.
+        """
+        start, end = self.node_cells[0], self.node_cells[-1]
+        colour = lambda index: sum(self.cell_position(index)) % 2
+        same_colour = sum(1 for index in range(self.total_cells) if colour(index) == colour(start))
+        if same_colour != (self.total_cells + 1) // 2:
+            return True
+        return (colour(end) == colour(start)) != (self.total_cells % 2 == 1)
+
+    def order_warnsdorff(self, current: int, visited: int, next_node_index: int) -> List[int]:
+        """Neighbours with the fewest free onward neighbours first."""
+        masks = self.neighbour_masks
+        return sorted(self.adjacency[current], key=lambda n: bin(masks[n] & ~visited).count("1"))
+
+    def order_waypoint(self, current: int, visited: int, next_node_index: int) -> List[int]:
+        """Neighbours closest (Manhattan distance) to the next numbered node first."""
+        target = min(next_node_index, len(self.node_cells) - 1)
+        return sorted(self.adjacency[current], key=self.waypoint_distances[target].__getitem__)
+
     def is_edge_blocked(self, cell1: Tuple[int, int], cell2: Tuple[int, int]) -> bool:
         """Check if the edge between two positions is blocked by a wall."""
         edge = (cell1, cell2)
@@ -49,10 +362,9 @@ class ZipSolver:
     def get_neighbours(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Get valid neighbouring positions (up, down, left, right) that aren't blocked by walls or already occupied"""
         row, col = pos
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
         neighbours = []
         #check each direction
-        for dr, dc in directions:
+        for dr, dc in self.directions:
             new_row, new_col = row + dr, col + dc
             neighbour = (new_row, new_col)
             #Checks bounds
@@ -62,9 +374,8 @@ class ZipSolver:
                     neighbours.append(neighbour)
         return neighbours
     
-    def hamiltonian_path(self, current: Tuple[int, int], 
-                visited: set[Tuple[int, int]],
-                path: List[Tuple[int, int]],
+    def hamiltonian_path(self, current: int, visited: int,
+                path: List[int],
                 next_node_index: int) -> bool:
         """
         ALGORITHM:
@@ -74,62 +385,752 @@ class ZipSolver:
         4. Must visit all cells on the board
         5. End at final node
         Args:
-            current: Current cell position
-            visited: Set of cells already visited
-            path: Current path taken
+            current: Index of the current cell
+            visited: Bitmask of cells already visited
+            path: Cell indices of the current path taken
             next_node_idx: Index of next required node to visit
         
         Returns:
             True if valid Hamilton path found, False otherwise
+
+        hamiltonian_path_stats() is a copy of this with statistics counters, keep the two in sync.
         """
-        
+        node_cells = self.node_cells
+        self.nodes_expanded += 1
+        if self.nodes_expanded >= self.next_checkpoint:
+            self.checkpoint()
+        if len(path) > len(self.deepest_path):
+            self.deepest_path = path.copy()
+
         #Base Case: Checks if all nodes visited and all cells filled
-        if len(visited) == self.total_cells:
-            if current == self.nodes[-1]:
-                self.solution_path = path.copy()
+        if visited == self.full_mask:
+            if current == node_cells[-1]:
+                self.solution_path = [self.cell_position(index) for index in path]
                 return True
             return False
         
+        #Skip states already proven dead through another prefix
+        dead_states = self.dead_states
+        if dead_states is not None:
+            state = visited * self.total_cells + current
+            self.dead_cache_lookups += 1
+            if state in dead_states:
+                self.dead_cache_hits += 1
+                dead_states.move_to_end(state)
+                return False
+
         #Check if current cell is the next required node
-        if (next_node_index < len(self.nodes) and current == self.nodes[next_node_index]):
+        if (next_node_index < len(node_cells) and current == node_cells[next_node_index]):
             next_node_index += 1
 
+        #Cut branches that can no longer fill the board
+        for name, prune in self.node_prunes:
+            if prune(current, visited):
+                self.prune_counts[name] += 1
+                return False
+
         #Explore neighbours using DFS
-        for neighbour in self.get_neighbours(current):
-            if neighbour in visited:
+        node_order = self.node_order
+        order_moves = self.order_moves
+        moves = self.adjacency[current] if order_moves is None else order_moves(current, visited, next_node_index)
+        for neighbour in moves:
+            bit = 1 << neighbour
+            if visited & bit:
                 continue
 
-            #Can't skip required nodes, if neighbour is a required node that is not next, skip it
-            if next_node_index < len(self.nodes):
-                future_nodes = self.nodes[next_node_index:]
-                if neighbour in future_nodes and neighbour != self.nodes[next_node_index]:
-                    continue            #Skip this neighbour (out of order)
+            #Can't skip required nodes, earlier nodes are already visited so any higher order is out of order
+            if node_order[neighbour] > next_node_index:
+                continue            #Skip this neighbour (out of order)
             #Explore this path
-            visited.add(neighbour)
             path.append(neighbour)
 
-            if self.hamiltonian_path(neighbour, visited, path, next_node_index):
+            if self.hamiltonian_path(neighbour, visited | bit, path, next_node_index):
                 return True
 
             #Backtrack
             path.pop()
-            visited.remove(neighbour)
+
+        if dead_states is not None:
+            self.remember_dead(state)
+        return False
+
+    def hamiltonian_path_stats(self, current: int, visited: int,
+                path: List[int],
+                next_node_index: int) -> bool:
+        """
+        hamiltonian_path() that also counts backtracks per depth and the moves it rejects
+        into self.stats. Kept as a separate copy so the plain DFS pays nothing for it,
+        any change to hamiltonian_path() has to be made here too.
+        """
+        node_cells = self.node_cells
+        stats = self.stats
+        self.nodes_expanded += 1
+        if self.nodes_expanded >= self.next_checkpoint:
+            self.checkpoint()
+        if len(path) > len(self.deepest_path):
+            self.deepest_path = path.copy()
+
+        if visited == self.full_mask:
+            if current == node_cells[-1]:
+                self.solution_path = [self.cell_position(index) for index in path]
+                return True
+            stats.prunes["wrong_end"] += 1
+            return False
+
+        dead_states = self.dead_states
+        if dead_states is not None:
+            state = visited * self.total_cells + current
+            self.dead_cache_lookups += 1
+            if state in dead_states:
+                self.dead_cache_hits += 1
+                dead_states.move_to_end(state)
+                return False
+
+        if (next_node_index < len(node_cells) and current == node_cells[next_node_index]):
+            next_node_index += 1
+
+        for name, prune in self.node_prunes:
+            if prune(current, visited):
+                self.prune_counts[name] += 1
+                return False
+
+        node_order = self.node_order
+        order_moves = self.order_moves
+        backtracks = stats.backtracks_per_depth
+        moves = self.adjacency[current] if order_moves is None else order_moves(current, visited, next_node_index)
+        for neighbour in moves:
+            bit = 1 << neighbour
+            if visited & bit:
+                continue
+            if node_order[neighbour] > next_node_index:
+                stats.prunes["out_of_order"] += 1
+                continue
+            path.append(neighbour)
+
+            if self.hamiltonian_path_stats(neighbour, visited | bit, path, next_node_index):
+                return True
+
+            backtracks[len(path)] += 1
+            path.pop()
+
+        if dead_states is not None:
+            self.remember_dead(state)
         return False
         
-    def solve(self) -> bool:
+    def remember_dead(self, state: int):
+        """Add a proven-dead state to the transposition cache, evicting the least recently used."""
+        self.dead_states[state] = None
+        if len(self.dead_states) > self.dead_cache_size:
+            self.dead_states.popitem(last=False)
+
+    def dead_cache_stats(self) -> Dict[str, float]:
+        """Transposition cache lookups, hits, hit rate, entries and approximate memory in bytes."""
+        if self.dead_states is None:
+            return {}
+        lookups, hits = self.dead_cache_lookups, self.dead_cache_hits
+        memory = sys.getsizeof(self.dead_states) + sum(sys.getsizeof(state) for state in self.dead_states)
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": len(self.dead_states),
+            "bytes": memory,
+        }
+
+    def checkpoint(self):
+        """
+        Called every CHECK_INTERVAL nodes (and on reaching max_nodes). Raises SearchStopped
+        when the solve is out of budget or was cancelled, otherwise schedules the next check.
+        """
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            raise SearchStopped(SolveStatus.CANCELLED)
+        if self.max_nodes is not None and self.nodes_expanded >= self.max_nodes:
+            raise SearchStopped(SolveStatus.BUDGET_EXHAUSTED)
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchStopped(SolveStatus.BUDGET_EXHAUSTED)
+
+        if self.progress is not None and self.nodes_expanded >= self.next_progress:
+            self.next_progress = self.nodes_expanded + self.progress_interval
+            self.progress(self.search_stats())
+        self.schedule_checkpoint()
+
+    def schedule_checkpoint(self):
+        """Set the next checkpoint() CHECK_INTERVAL nodes on, or sooner for max_nodes or a progress report."""
+        self.next_checkpoint = self.nodes_expanded + CHECK_INTERVAL
+        if self.max_nodes is not None:
+            self.next_checkpoint = min(self.next_checkpoint, self.max_nodes)
+        if self.progress is not None:
+            self.next_checkpoint = min(self.next_checkpoint, self.next_progress)
+
+    def search_stats(self) -> SearchStats:
+        """Bring self.stats up to date with the search counters and return it."""
+        stats = self.stats
+        stats.nodes_expanded = self.nodes_expanded
+        stats.elapsed = time.perf_counter() - self.stats_start
+        stats.max_depth = max(stats.max_depth, len(self.deepest_path))
+        if self.strategy == "recursive":
+            stats.depth = len(self.search_path)
+        elif self.strategy == "iterative":
+            stats.depth = self.stack_depth + 1
+
+        prune_base, hits_base = self.stats_base
+        for name in self.pruning:
+            stats.prunes[name] = self.prune_counts[name] - prune_base[name]
+        if self.dead_states is not None:
+            stats.prunes["dead_cache"] = self.dead_cache_hits - hits_base
+        return stats
+
+    def start_search(self, prefix: Optional[List[Tuple[int, int]]] = None):
+        """
+        Set up the iterative engine at the start node, or at the end of a fixed path prefix.
+        Call resume() to run it.
+        """
+        self.nodes_expanded = 0
+        self.deepest_path = []
+        self.stack_depth = -1
+        self.search_result = None
+
+        if not self.nodes:
+            self.search_result = False
+            return
+
+        if "parity" in self.prune_counts and self.prune_parity():
+            self.prune_counts["parity"] += 1
+            self.search_result = False
+            return
+
+        #Enter the last prefix cell exactly like the recursive engine does
+        path, visited, next_node_index = self.prefix_state(prefix)
+        current = path[-1]
+        self.stack_visited = visited
+        self.nodes_expanded = 1
+        self.deepest_path = path.copy()
+
+        if visited == self.full_mask:
+            self.search_result = current == self.node_cells[-1]
+            if self.search_result:
+                self.solution_path = [self.cell_position(index) for index in path]
+            return
+
+        if next_node_index < len(self.node_cells) and current == self.node_cells[next_node_index]:
+            next_node_index += 1
+
+        for name, prune in self.node_prunes:
+            if prune(current, visited):
+                self.prune_counts[name] += 1
+                self.search_result = False
+                return
+
+        #Prefix cells are fixed, so their records have nothing left to try
+        for depth, cell in enumerate(path):
+            self.stack_cells[depth] = cell
+            self.stack_moves[depth] = iter(())
+        self.stack_depth = self.stack_base = len(path) - 1
+        if self.order_moves is None:
+            self.stack_moves[self.stack_depth] = iter(self.adjacency[current])
+        else:
+            self.stack_moves[self.stack_depth] = iter(self.order_moves(current, visited, next_node_index))
+        self.stack_next_nodes[self.stack_depth] = next_node_index
+
+    def prefix_state(self, prefix: Optional[List[Tuple[int, int]]] = None) -> Tuple[List[int], int, int]:
+        """
+        Search state at the end of a path prefix that starts at node 1.
+
+        Returns:
+            (path, visited, next_node_index) to enter the last prefix cell with
+        """
+        if not prefix:
+            start_node = self.node_cells[0]
+            return [start_node], 1 << start_node, 1
+
+        path = [self.cell_index(cell) for cell in prefix]
+        if path[0] != self.node_cells[0]:
+            raise ValueError(f"Prefix must start at node 1 {self.nodes[0]}, got {prefix[0]}")
+
+        visited = 0
+        next_node_index = 1
+        for step, cell in enumerate(path):
+            if visited & (1 << cell):
+                raise ValueError(f"Prefix visits {prefix[step]} twice")
+            if step > 0:
+                if cell not in self.adjacency[path[step - 1]]:
+                    raise ValueError(f"Prefix steps from {prefix[step - 1]} to {prefix[step]} across a wall or gap")
+                if self.node_order[cell] > next_node_index:
+                    raise ValueError(f"Prefix reaches {prefix[step]} out of order")
+            visited |= 1 << cell
+            if step < len(path) - 1 and next_node_index < len(self.node_cells) and cell == self.node_cells[next_node_index]:
+                next_node_index += 1
+        return path, visited, next_node_index
+
+    def resume(self, max_nodes: Optional[int] = None) -> Optional[bool]:
+        """
+        Run the iterative engine from where it last stopped.
+
+        Args:
+            max_nodes: Pause once this many more nodes have been expanded (checked between
+                stack records, so a slice can overrun by up to three nodes), None for no limit
+
+        Returns:
+            True if a solution was found, False if the search space is exhausted,
+            None if it paused after max_nodes and can be resumed again
+        """
+        if self.search_result is not None:
+            return self.search_result
+
+        expanded = self.nodes_expanded
+        stop_at = expanded + max_nodes if max_nodes is not None else 1 << 62
+        adjacency = self.adjacency
+        node_order = self.node_order
+        node_cells = self.node_cells
+        node_count = len(node_cells)
+        end_cell = node_cells[-1]
+        full_mask = self.full_mask
+        node_prunes = self.node_prunes
+        order_moves = self.order_moves
+        dead_states = self.dead_states
+        total_cells = self.total_cells
+        cells = self.stack_cells
+        moves = self.stack_moves
+        next_nodes = self.stack_next_nodes
+        depth = self.stack_depth
+        visited = self.stack_visited
+        deepest_length = len(self.deepest_path)
+
+        #Statistics, only touched on the paths that reject a move or backtrack
+        counting = self.stats is not None
+        if counting:
+            backtracks = self.stats.backtracks_per_depth
+            prunes = self.stats.prunes
+
+        while depth >= 0:
+            if expanded >= stop_at:
+                #Out of budget, the stack already records where to pick up
+                self.stack_depth = depth
+                self.stack_visited = visited
+                self.nodes_expanded = expanded
+                return None
+
+            next_node_index = next_nodes[depth]
+            for neighbour in moves[depth]:
+                bit = 1 << neighbour
+                if visited & bit:
+                    continue
+                if node_order[neighbour] > next_node_index:
+                    if counting:
+                        prunes["out_of_order"] += 1
+                    continue
+
+                expanded += 1
+                child_visited = visited | bit
+                if depth + 2 > deepest_length:
+                    deepest_length = depth + 2
+                    self.deepest_path = cells[:depth + 1] + [neighbour]
+
+                #Board full: solved if we ended on the final node
+                if child_visited == full_mask:
+                    if neighbour == end_cell:
+                        self.solution_path = [self.cell_position(cell) for cell in cells[:depth + 1]]
+                        self.solution_path.append(self.cell_position(neighbour))
+                        self.stack_depth = -1
+                        self.nodes_expanded = expanded
+                        self.search_result = True
+                        return True
+                    if counting:
+                        prunes["wrong_end"] += 1
+                        backtracks[depth + 2] += 1
+                    continue
+
+                if dead_states is not None:
+                    state = child_visited * total_cells + neighbour
+                    self.dead_cache_lookups += 1
+                    if state in dead_states:
+                        self.dead_cache_hits += 1
+                        dead_states.move_to_end(state)
+                        if counting:
+                            backtracks[depth + 2] += 1
+                        continue
+
+                child_next_node = next_node_index
+                if child_next_node < node_count and neighbour == node_cells[child_next_node]:
+                    child_next_node += 1
+
+                for name, prune in node_prunes:
+                    if prune(neighbour, child_visited):
+                        self.prune_counts[name] += 1
+                        if counting:
+                            backtracks[depth + 2] += 1
+                        break
+                else:
+                    #Push the neighbour
+                    depth += 1
+                    cells[depth] = neighbour
+                    if order_moves is None:
+                        moves[depth] = iter(adjacency[neighbour])
+                    else:
+                        moves[depth] = iter(order_moves(neighbour, child_visited, child_next_node))
+                    next_nodes[depth] = child_next_node
+                    visited = child_visited
+                    break
+            else:
+                #No neighbour left, backtrack
+                if dead_states is not None and depth >= self.stack_base:
+                    self.remember_dead(visited * total_cells + cells[depth])
+                if counting and depth > self.stack_base:
+                    backtracks[depth + 1] += 1
+                visited &= ~(1 << cells[depth])
+                depth -= 1
+
+        self.stack_depth = -1
+        self.stack_visited = 0
+        self.nodes_expanded = expanded
+        self.search_result = False
+        return False
+
+    @traced("solver.solve")
+    def solve(self, timeout: Optional[float] = None, max_nodes: Optional[int] = None,
+              cancel: Optional[CancelToken] = None,
+              prefix: Optional[List[Tuple[int, int]]] = None) -> SolveResult:
+        """
+        Main solve function. Must fill ALL cells on the board.
+
+        Args:
+            timeout: Give up after this many seconds, None for no deadline
+            max_nodes: Give up after expanding this many nodes, None for no limit
+            cancel: Token another thread can trigger to stop the search
+            prefix: Only search paths that start with these cells (from frontier()),
+                    an exhausted search then only proves this prefix unsolvable
+
+        Returns:
+            SolveResult with the status, nodes expanded and deepest partial path.
+            It is truthy only when a solution was found.
         """
-        Main solve function. Returns True if solution found.
-        Must fill ALL cells on the board.
+        start_time = time.perf_counter()
+        self.deadline = start_time + timeout if timeout is not None else None
+        self.max_nodes = max_nodes
+        self.cancel_token = cancel
+        self.solution_path = []
+
+        if self.collect_stats:
+            prunes = {name: 0 for name in self.pruning}
+            backtracks = []
+            if self.strategy in ("recursive", "iterative"):
+                prunes.update(out_of_order=0, wrong_end=0)
+                backtracks = [0] * (self.total_cells + 1)
+            self.stats = SearchStats(backtracks_per_depth=backtracks, prunes=prunes)
+            self.stats_start = start_time
+            self.stats_base = (dict(self.prune_counts), self.dead_cache_hits)
+            self.next_progress = self.progress_interval
+
+        # A board solved before (in any orientation) needs no search
+        if self.solution_cache is not None and prefix is None:
+            with tracer.span("solver.cache"):
+                cached = self.solution_cache.get((self.rows, self.cols), self.pairs, self.walls)
+            if cached:
+                self.solution_path = cached
+                self.nodes_expanded = 0
+                if self.stats is not None:
+                    self.stats.elapsed = time.perf_counter() - start_time
+                return SolveResult(status=SolveStatus.SOLVED, nodes_expanded=0,
+                                   elapsed=time.perf_counter() - start_time, path=cached, cached=True)
+
+        try:
+            with tracer.span("solver.search"):
+                if self.strategy == "iterative":
+                    solved = self.run_iterative(prefix)
+                elif self.strategy == "segments":
+                    solved = self.run_segments(prefix)
+                elif self.strategy == "cp_sat":
+                    solved = self.run_cp_sat(prefix)
+                else:
+                    solved = self.run_recursive(prefix)
+            status = SolveStatus.SOLVED if solved else SolveStatus.UNSOLVABLE
+        except SearchStopped as stopped:
+            status = stopped.status
+
+        if status == SolveStatus.SOLVED and self.solution_cache is not None and prefix is None:
+            self.solution_cache.put((self.rows, self.cols), self.pairs, self.walls, self.solution_path)
+        if self.stats is not None:
+            self.search_stats()
+
+        return SolveResult(
+            status=status,
+            nodes_expanded=self.nodes_expanded,
+            elapsed=time.perf_counter() - start_time,
+            path=self.solution_path,
+            deepest_path=[self.cell_position(index) for index in self.deepest_path],
+        )
+
+    def frontier(self, depth: int) -> List[List[Tuple[int, int]]]:
         """
+        Split the search tree at depth: every path prefix of depth moves from node 1 that
+        survives the DFS move rules and pruning, in the order the DFS would reach them.
+        Solving each one with solve(prefix=...) covers the whole search space.
+        """
+        prefixes: List[List[Tuple[int, int]]] = []
+        if not self.nodes:
+            return prefixes
+        if "parity" in self.prune_counts and self.prune_parity():
+            self.prune_counts["parity"] += 1
+            return prefixes
+
+        start_node = self.node_cells[0]
+        self.expand_frontier([start_node], 1 << start_node, 1, depth, prefixes)
+        return prefixes
+
+    def expand_frontier(self, path: List[int], visited: int, next_node_index: int,
+                        depth: int, prefixes: List[List[Tuple[int, int]]]):
+        """Collect the prefixes below path for frontier(), mirroring hamiltonian_path."""
+        current = path[-1]
+        if visited == self.full_mask:
+            if current == self.node_cells[-1]:
+                prefixes.append([self.cell_position(index) for index in path])
+            return
+        if len(path) > depth:
+            prefixes.append([self.cell_position(index) for index in path])
+            return
+
+        if next_node_index < len(self.node_cells) and current == self.node_cells[next_node_index]:
+            next_node_index += 1
+
+        for name, prune in self.node_prunes:
+            if prune(current, visited):
+                self.prune_counts[name] += 1
+                return
+
+        moves = self.adjacency[current] if self.order_moves is None else self.order_moves(current, visited, next_node_index)
+        for neighbour in moves:
+            bit = 1 << neighbour
+            if visited & bit or self.node_order[neighbour] > next_node_index:
+                continue
+            self.expand_frontier(path + [neighbour], visited | bit, next_node_index, depth, prefixes)
+
+    def run_recursive(self, prefix: Optional[List[Tuple[int, int]]] = None) -> bool:
+        """Run the recursive engine from the start node, or from the end of a path prefix."""
+        self.nodes_expanded = 0
+        self.deepest_path = []
+        self.search_path = []
+        self.schedule_checkpoint()
         if not self.nodes:
             return False
+
+        if "parity" in self.prune_counts and self.prune_parity():
+            self.prune_counts["parity"] += 1
+            return False
         
-        start_node = self.nodes[0]
-        visited = {start_node}
-        path = [start_node]
+        path, visited, next_node_index = self.prefix_state(prefix)
+        self.search_path = path
         
-        return self.hamiltonian_path(start_node, visited, path, 1)
+        search = self.hamiltonian_path if self.stats is None else self.hamiltonian_path_stats
+        return search(path[-1], visited, path, next_node_index)
+
+    def run_iterative(self, prefix: Optional[List[Tuple[int, int]]] = None) -> bool:
+        """Run the iterative engine in CHECK_INTERVAL slices, checking the budget in between."""
+        self.start_search(prefix)
+        self.schedule_checkpoint()
+        while True:
+            result = self.resume(max_nodes=self.next_checkpoint - self.nodes_expanded)
+            if result is not None:
+                return result
+            self.checkpoint()
     
+    def run_segments(self, prefix: Optional[List[Tuple[int, int]]] = None) -> bool:
+        """
+        Solve leg by leg: find the distinct ways to go from node k to node k+1 given the
+        cells already occupied, then stitch legs together. Stitch states (leg, occupied mask)
+        that failed are remembered, so legs that end up covering the same cells are only
+        followed once.
+        """
+        if prefix:
+            raise ValueError("The segments strategy doesn't support path prefixes")
+
+        self.nodes_expanded = 0
+        self.deepest_path = []
+        self.schedule_checkpoint()
+        self.dead_legs = set()
+        if not self.nodes:
+            return False
+
+        if "parity" in self.prune_counts and self.prune_parity():
+            self.prune_counts["parity"] += 1
+            return False
+
+        start_node = self.node_cells[0]
+        return self.stitch_legs(0, 1 << start_node, [start_node])
+
+    def stitch_legs(self, leg: int, occupied: int, path: List[int]) -> bool:
+        """
+        Try every distinct way to run leg (node leg -> node leg+1) from this state, then the rest.
+
+        Args:
+            leg: Index of the numbered node the path is currently at
+            occupied: Bitmask of cells used so far
+            path: Cell indices of the path so far, ending at node leg
+        """
+        if len(path) > len(self.deepest_path):
+            self.deepest_path = path.copy()
+
+        #The last leg only accepts board-filling paths, so arriving at the final node is a solution
+        if leg == len(self.node_cells) - 1:
+            if occupied == self.full_mask:
+                self.solution_path = [self.cell_position(index) for index in path]
+                return True
+            return False
+
+        state = (leg, occupied)
+        if state in self.dead_legs:
+            return False
+
+        #The remaining legs need at least their Manhattan distances in free cells
+        free_cells = bin(self.full_mask & ~occupied).count("1")
+        if self.legs_remaining[leg] > free_cells:
+            self.dead_legs.add(state)
+            return False
+
+        for new_occupied, leg_path in self.leg_paths(leg, occupied):
+            if self.stitch_legs(leg + 1, new_occupied, path + leg_path):
+                return True
+
+        self.dead_legs.add(state)
+        return False
+
+    def leg_paths(self, leg: int, occupied: int) -> Iterator[Tuple[int, List[int]]]:
+        """
+        Distinct ways to walk from node leg to node leg+1 through free, unnumbered cells,
+        generated lazily. Paths that occupy the same cells are interchangeable for the rest
+        of the board, so only the first one per resulting mask is yielded.
+
+        Yields:
+            (new occupied mask, leg cells after node leg) in search order
+        """
+        found: set[int] = set()
+        start = self.node_cells[leg]
+        last_leg = leg + 1 == len(self.node_cells) - 1
+        for new_occupied, leg_path in self.extend_leg(leg, start, occupied, [], self.full_mask & ~occupied, last_leg):
+            if new_occupied not in found:
+                found.add(new_occupied)
+                yield new_occupied, leg_path
+                if last_leg:
+                    break
+
+    def extend_leg(self, leg: int, current: int, occupied: int, leg_path: List[int],
+                   free: int, last_leg: bool) -> Iterator[Tuple[int, List[int]]]:
+        """DFS behind leg_paths(), yields every leg path that reaches node leg+1."""
+        self.nodes_expanded += 1
+        if self.nodes_expanded >= self.next_checkpoint:
+            self.checkpoint()
+
+        for name, prune in self.node_prunes:
+            if prune(current, occupied):
+                self.prune_counts[name] += 1
+                return
+
+        target = self.node_cells[leg + 1]
+        target_distances = self.waypoint_distances[leg + 1]
+        legs_after = self.legs_remaining[leg + 1]
+        node_order = self.node_order
+        moves = self.adjacency[current] if self.order_moves is None else self.order_moves(current, occupied, leg + 1)
+        for neighbour in moves:
+            bit = 1 << neighbour
+            if occupied & bit:
+                continue
+
+            if neighbour == target:
+                if not last_leg or occupied | bit == self.full_mask:
+                    yield occupied | bit, leg_path + [neighbour]
+                continue
+
+            #Can't pass through any other numbered node
+            if node_order[neighbour] != -1:
+                continue
+
+            #Distance lower bound: this leg and the ones after must still fit in the free cells
+            remaining = free & ~bit
+            if target_distances[neighbour] + legs_after > bin(remaining).count("1"):
+                continue
+
+            leg_path.append(neighbour)
+            yield from self.extend_leg(leg, neighbour, occupied | bit, leg_path, remaining, last_leg)
+            leg_path.pop()
+
+    def run_cp_sat(self, prefix: Optional[List[Tuple[int, int]]] = None) -> bool:
+        """
+        Solve exactly with OR-Tools CP-SAT: the path is a circuit through every cell plus a
+        dummy node joining the final node back to node 1, arcs only where there is no wall,
+        and each cell gets a path position so the numbered nodes come in order.
+        Falls back to the recursive DFS if OR-Tools isn't installed.
+        max_nodes doesn't apply, nodes_expanded reports CP-SAT's branch count.
+        """
+        try:
+            from ortools.sat.python import cp_model
+        except ImportError:
+            print("⚠ OR-Tools not installed (pip install ortools), using the DFS instead")
+            return self.run_recursive(prefix)
+
+        self.nodes_expanded = 0
+        self.deepest_path = []
+        if not self.nodes:
+            return False
+
+        model = cp_model.CpModel()
+        last = self.total_cells - 1
+        dummy = self.total_cells
+        start, end = self.node_cells[0], self.node_cells[-1]
+
+        #Position of each cell along the path
+        positions = [model.NewIntVar(0, last, f"pos_{index}") for index in range(self.total_cells)]
+        model.Add(positions[start] == 0)
+        model.Add(positions[end] == last)
+        for earlier, later in zip(self.node_cells, self.node_cells[1:]):
+            model.Add(positions[earlier] < positions[later])
+
+        arcs = [(dummy, start, model.NewConstant(1)), (end, dummy, model.NewConstant(1))]
+        successors: Dict[int, List[Tuple[int, object]]] = {}
+        for index, neighbours in enumerate(self.adjacency):
+            for neighbour in neighbours:
+                if index == end or neighbour == start:
+                    continue
+                arc = model.NewBoolVar(f"arc_{index}_{neighbour}")
+                model.Add(positions[neighbour] == positions[index] + 1).OnlyEnforceIf(arc)
+                arcs.append((index, neighbour, arc))
+                successors.setdefault(index, []).append((neighbour, arc))
+        model.AddCircuit(arcs)
+
+        #Pin the prefix, if any
+        if prefix:
+            path, _, _ = self.prefix_state(prefix)
+            for step, cell in enumerate(path):
+                model.Add(positions[cell] == step)
+
+        solver = cp_model.CpSolver()
+        if self.deadline is not None:
+            solver.parameters.max_time_in_seconds = max(0.0, self.deadline - time.perf_counter())
+
+        #CP-SAT blocks, so watch the cancel token from a helper thread
+        finished = threading.Event()
+        if self.cancel_token is not None:
+            def watch_cancel():
+                while not finished.wait(0.01):
+                    if self.cancel_token.cancelled:
+                        solver.StopSearch()
+                        return
+            threading.Thread(target=watch_cancel, daemon=True).start()
+        try:
+            status = solver.Solve(model)
+        finally:
+            finished.set()
+        self.nodes_expanded = solver.NumBranches()
+
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            order = sorted(range(self.total_cells), key=lambda index: solver.Value(positions[index]))
+            self.solution_path = [self.cell_position(index) for index in order]
+            self.deepest_path = order
+            return True
+        if status == cp_model.INFEASIBLE:
+            return False
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            raise SearchStopped(SolveStatus.CANCELLED)
+        raise SearchStopped(SolveStatus.BUDGET_EXHAUSTED)
+
     def print_solution(self):
         """Print the solution paths in a readable format."""
         if not self.solution_path:
@@ -157,3 +1158,92 @@ class ZipSolver:
         for row in grid:
             print(' '.join(row))
 
+
+
+def portfolio_configs(count: int) -> List[Dict]:
+    """Solver options for count portfolio members: every ordering policy, then again with other direction orders."""
+    configs = [{"ordering": ordering, "directions": directions}
+               for directions in DIRECTION_ORDERS for ordering in ORDERINGS]
+    return configs[:count]
+
+def portfolio_worker(grid_size: Tuple[int, int], pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+                     walls: Optional[set[Tuple[Tuple[int, int], Tuple[int, int]]]], options: Dict,
+                     prefix: Optional[List[Tuple[int, int]]], cancel_event) -> SolveResult:
+    """Run one portfolio member in a worker process until it finishes or the shared event is set."""
+    solver = ZipSolver(grid_size, pairs, walls, **options)
+    return solver.solve(cancel=CancelToken(cancel_event), prefix=prefix)
+
+def solve_portfolio(grid_size: Tuple[int, int], pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+                    walls: Optional[set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None,
+                    configs: Optional[List[Dict]] = None, split_depth: Optional[int] = None,
+                    workers: Optional[int] = None, timeout: Optional[float] = None) -> SolveResult:
+    """
+    Solve with several searches at once in a process pool, take the first solution and cancel the rest.
+
+    Args:
+        grid_size, pairs, walls: Same as ZipSolver
+        configs: ZipSolver options for each portfolio member, defaults to portfolio_configs(workers)
+        split_depth: If set, split one search (configs[0]) into every prefix of this many moves
+                     and spread those across the pool instead of racing different configs
+        workers: Number of processes, defaults to the CPU count
+        timeout: Give up after this many seconds, None for no deadline
+
+    Returns:
+        SolveResult of the winning search, with nodes_expanded summed over the searches that finished
+    """
+    start_time = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    configs = configs or portfolio_configs(workers)
+
+    if split_depth is None:
+        tasks = [(options, None) for options in configs]
+    else:
+        splitter = ZipSolver(grid_size, pairs, walls, **configs[0])
+        tasks = [(configs[0], prefix) for prefix in splitter.frontier(split_depth)]
+        if not tasks:
+            return SolveResult(SolveStatus.UNSOLVABLE, 0, time.perf_counter() - start_time)
+
+    deadline = start_time + timeout if timeout is not None else None
+    results: List[SolveResult] = []
+    status = None
+    winner = None
+
+    with multiprocessing.Manager() as manager:
+        cancel_event = manager.Event()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = {pool.submit(portfolio_worker, grid_size, pairs, walls, options, prefix, cancel_event)
+                       for options, prefix in tasks}
+
+            while pending and status is None:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    status = SolveStatus.BUDGET_EXHAUSTED
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results.append(result)
+                    if result:
+                        status, winner = SolveStatus.SOLVED, result
+                        break
+                    #Any complete portfolio search proves it, a split needs every prefix exhausted
+                    if result.status == SolveStatus.UNSOLVABLE and split_depth is None:
+                        status = SolveStatus.UNSOLVABLE
+
+            #Stop the losers: drop queued tasks and signal the running ones
+            cancel_event.set()
+            for future in pending:
+                future.cancel()
+
+    if status is None:
+        all_exhausted = all(result.status == SolveStatus.UNSOLVABLE for result in results)
+        status = SolveStatus.UNSOLVABLE if all_exhausted else SolveStatus.BUDGET_EXHAUSTED
+
+    deepest = max((result.deepest_path for result in results), key=len, default=[])
+    return SolveResult(
+        status=status,
+        nodes_expanded=sum(result.nodes_expanded for result in results),
+        elapsed=time.perf_counter() - start_time,
+        path=winner.path if winner else [],
+        deepest_path=winner.path if winner else deepest,
+    )
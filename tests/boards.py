@@ -0,0 +1,57 @@
+"""Synthetic Zip boards and screens drawn with OpenCV, for the fixture-image tests."""
+import cv2
+import numpy as np
+from typing import Dict, Iterable, List, Tuple
+
+Cell = Tuple[int, int]
+
+def render_board(rows: int, cols: int, numbers: Dict[Cell, int], walls: Iterable[Tuple[Cell, Cell]] = (),
+                 cell: int = 50) -> np.ndarray:
+    """
+    Board image (BGR) cropped to the outer grid line: white cells, light grey grid lines,
+    black number badges and thick black walls between adjacent cells.
+    """
+    height, width = rows * cell, cols * cell
+    img = np.full((height, width, 3), 255, np.uint8)
+    for row in range(rows + 1):
+        y = min(row * cell, height - 1)
+        cv2.line(img, (0, y), (width - 1, y), (200, 200, 200), 1)
+    for col in range(cols + 1):
+        x = min(col * cell, width - 1)
+        cv2.line(img, (x, 0), (x, height - 1), (200, 200, 200), 1)
+
+    for (row, col), number in numbers.items():
+        centre = (col * cell + cell // 2, row * cell + cell // 2)
+        cv2.circle(img, centre, int(cell * 0.33), (0, 0, 0), -1)
+        text = str(number)
+        (text_width, text_height), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, cell / 80, 2)
+        cv2.putText(img, text, (centre[0] - text_width // 2, centre[1] + text_height // 2),
+                    cv2.FONT_HERSHEY_SIMPLEX, cell / 80, (255, 255, 255), 2)
+
+    for (r1, c1), (r2, c2) in walls:
+        if r1 != r2:
+            y = max(r1, r2) * cell
+            cv2.line(img, (c1 * cell, y), (c1 * cell + cell, y), (0, 0, 0), 6)
+        else:
+            x = max(c1, c2) * cell
+            cv2.line(img, (x, r1 * cell), (x, r1 * cell + cell), (0, 0, 0), 6)
+    return img
+
+def render_screen(board: np.ndarray, x: int, y: int, background: Tuple[int, int, int] = (255, 255, 255),
+                  size: Tuple[int, int] = (1920, 1080)) -> np.ndarray:
+    """Full screen image (BGR) with the board at (x, y) on a plain page background."""
+    screen = np.full((size[1], size[0], 3), background, np.uint8)
+    screen[y:y + board.shape[0], x:x + board.shape[1]] = board
+    return screen
+
+def random_board(size: int, seed: int) -> Tuple[Dict[Cell, int], List[Tuple[Cell, Cell]]]:
+    """size numbered cells and up to 2 * size distinct walls, each wall written (smaller cell, larger cell)."""
+    rng = np.random.default_rng(seed)
+    cells = [(row, col) for row in range(size) for col in range(size)]
+    picks = rng.choice(len(cells), size=size, replace=False)
+    numbers = {cells[index]: number + 1 for number, index in enumerate(picks)}
+    walls = set()
+    for _ in range(size * 2):
+        row, col = int(rng.integers(size - 1)), int(rng.integers(size - 1))
+        walls.add(((row, col), (row + 1, col)) if rng.random() < 0.5 else ((row, col), (row, col + 1)))
+    return numbers, sorted(walls)
@@ -0,0 +1,32 @@
+import pytest
+from boards import render_board, render_screen
+from vision import ZipVision
+
+NUMBERS = {(0, 0): 1, (3, 3): 2, (5, 5): 3}
+WALLS = [((1, 1), (1, 2))]
+
+#White, LinkedIn's off-white #EEF2F3 (BGR), light grey and a dark page
+BACKGROUNDS = [(255, 255, 255), (243, 242, 238), (215, 215, 210), (40, 40, 40)]
+
+@pytest.mark.parametrize("background", BACKGROUNDS)
+@pytest.mark.parametrize("size, cell, x, y", [(6, 50, 304, 154), (8, 55, 1000, 200), (15, 40, 500, 100)])
+def test_locate_board_snaps_to_outer_grid_lines(size, cell, x, y, background):
+    board = render_board(size, size, NUMBERS, WALLS, cell=cell)
+    vision = ZipVision()
+
+    assert vision.locate_board(render_screen(board, x, y, background), cache_path=None)
+    assert vision.board_area == (x, y, size * cell, size * cell)
+
+@pytest.mark.parametrize("background", BACKGROUNDS)
+def test_grid_detected_with_page_margin(background):
+    # A hand-selected area a little bigger than the board still finds the board's grid
+    board = render_board(6, 6, NUMBERS, WALLS, cell=50)
+    screen = render_screen(board, 304, 154, background)
+    vision = ZipVision()
+    vision.board_area = (294, 144, 320, 320)
+
+    confidence = vision.detect_grid_structure(screen[144:464, 294:614])
+    assert confidence > 0.9
+    assert vision.grid_size == (6, 6)
+    assert vision.col_bounds[0] == pytest.approx(10, abs=1)
+    assert vision.col_bounds[-1] == pytest.approx(309, abs=1)
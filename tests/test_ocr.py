@@ -0,0 +1,25 @@
+import sys
+import types
+from boards import render_board
+from vision import ZipVision
+
+def test_ocr_mosaic_tiles_dark_numbers_on_white(monkeypatch):
+    # Stand-in for pytesseract that keeps the image it was given
+    seen = {}
+    def image_to_data(image, config=None, output_type=None):
+        seen["mosaic"] = image
+        return {"text": [], "left": [], "width": []}
+    fake = types.SimpleNamespace(image_to_data=image_to_data, Output=types.SimpleNamespace(DICT="dict"))
+    monkeypatch.setitem(sys.modules, "pytesseract", fake)
+
+    numbers = {(0, 0): 1, (1, 3): 2, (2, 5): 13, (6, 6): 7}
+    img = render_board(7, 7, numbers, [((1, 1), (1, 2))], cell=60)
+    vision = ZipVision()
+    vision.board_area = (0, 0, img.shape[1], img.shape[0])
+    vision.detect_grid_structure(img)
+    vision.detect_numbers_at_cells(img)
+
+    # Badges hold light numbers on black discs, the strip must hold only the numbers, dark on white
+    mosaic = seen["mosaic"]
+    assert (mosaic == 255).mean() > 0.8
+    assert mosaic[:, :5].min() == 255 and mosaic[:5].min() == 255
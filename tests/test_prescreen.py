@@ -0,0 +1,21 @@
+import cv2
+import pytest
+from boards import render_board, random_board
+from vision import ZipVision
+
+@pytest.mark.parametrize("size", [10, 12, 15])
+@pytest.mark.parametrize("board_pixels", [None, -2])
+def test_prescreen_keeps_only_numbered_cells(size, board_pixels):
+    numbers, walls = random_board(size, seed=size)
+    img = render_board(size, size, numbers, walls, cell=60)
+    if board_pixels:
+        # Fractional cell size (e.g. 59.87px), windows must follow the grid lines, not int(cell_size) steps
+        side = size * 60 + board_pixels
+        img = cv2.resize(img, (side, side), interpolation=cv2.INTER_AREA)
+
+    vision = ZipVision()
+    vision.board_area = (0, 0, img.shape[1], img.shape[0])
+    vision.detect_grid_structure(img)
+    assert vision.grid_size == (size, size)
+
+    assert sorted(vision.inked_cells(vision.threshold_board(img))) == sorted(numbers)
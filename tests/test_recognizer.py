@@ -0,0 +1,19 @@
+from boards import render_board
+from recognizer import DigitRecognizer
+from vision import ZipVision
+
+def test_learning_skips_numbers_already_read():
+    numbers = {(0, 0): 1, (1, 3): 2, (2, 5): 3, (6, 6): 4, (4, 1): 5}
+    img = render_board(7, 7, numbers, cell=60)
+    vision = ZipVision()
+    vision.board_area = (0, 0, img.shape[1], img.shape[0])
+    vision.detect_grid_structure(img)
+
+    recognizer = DigitRecognizer()
+    assert recognizer.learn_from_board(img, vision, numbers) == 5
+    assert recognizer.learn_from_board(img, vision, numbers) == 0
+    assert len(recognizer.labels) == 5
+
+    # A number the templates misread is learned
+    assert recognizer.learn_from_board(img, vision, {(0, 0): 7}) == 1
+    assert len(recognizer.labels) == 6
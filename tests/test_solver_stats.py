@@ -0,0 +1,15 @@
+import pytest
+from benchmark import puzzle_set
+from solver import ZipSolver
+
+@pytest.mark.parametrize("grid_size, pairs, walls", puzzle_set((6, 7), 3))
+def test_iterative_engine_counts_like_recursive(grid_size, pairs, walls):
+    recursive = ZipSolver(grid_size, pairs, walls, collect_stats=True)
+    iterative = ZipSolver(grid_size, pairs, walls, strategy="iterative", collect_stats=True)
+    result = recursive.solve()
+    assert iterative.solve().nodes_expanded == result.nodes_expanded
+
+    assert iterative.stats.backtracks_per_depth == recursive.stats.backtracks_per_depth
+    assert iterative.stats.prunes == recursive.stats.prunes
+    # Every node after the root is either on the solution or was backtracked from
+    assert sum(recursive.stats.backtracks_per_depth) == result.nodes_expanded - len(result.path)
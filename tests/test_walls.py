@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from boards import render_board, random_board
+from solver import ZipSolver
+from vision import ZipVision
+
+def detect(img: np.ndarray) -> ZipVision:
+    vision = ZipVision()
+    vision.board_area = (0, 0, img.shape[1], img.shape[0])
+    vision.detect_grid_structure(img)
+    return vision
+
+@pytest.mark.parametrize("size, cell", [(5, 60), (7, 50), (10, 45), (15, 40), (15, 60)])
+def test_wall_grid_matches_rendered_walls(size, cell):
+    numbers, walls = random_board(size, seed=size * cell)
+    img = render_board(size, size, numbers, walls, cell=cell)
+    vision = detect(img)
+    assert vision.grid_size == (size, size)
+
+    horizontal, vertical = vision.detect_wall_grid(img)
+    assert horizontal.shape == (size - 1, size) and vertical.shape == (size, size - 1)
+    for (r1, c1), (r2, c2) in walls:
+        assert (horizontal if r1 != r2 else vertical)[r1, c1]
+    assert horizontal.sum() + vertical.sum() == len(walls)
+
+    assert vision.wall_edges(horizontal, vertical) == set(walls)
+    assert vision.detect_walls(img) == set(walls)
+
+@pytest.mark.parametrize("size", [7, 15])
+def test_solver_accepts_wall_arrays(size):
+    numbers, walls = random_board(size, seed=size)
+    img = render_board(size, size, numbers, walls, cell=50)
+    vision = detect(img)
+    pairs = vision.identify_pairs_from_numbers(numbers)
+
+    from_arrays = ZipSolver((size, size), pairs, vision.detect_wall_grid(img))
+    from_edges = ZipSolver((size, size), pairs, set(walls))
+    assert from_arrays.walls == from_edges.walls
+    assert from_arrays.adjacency == from_edges.adjacency
+
+def test_solution_avoids_detected_walls():
+    # Snake path through a 5x5 board, walls across it everywhere the snake doesn't run
+    size = 5
+    path = [(row, col if row % 2 == 0 else size - 1 - col) for row in range(size) for col in range(size)]
+    numbers = {path[0]: 1, path[12]: 2, path[-1]: 3}
+    walls = [((row, col), (row + 1, col)) for row in range(size - 1) for col in range(1, size - 1)]
+    img = render_board(size, size, numbers, walls, cell=60)
+    vision = detect(img)
+
+    solver = ZipSolver((size, size), vision.identify_pairs_from_numbers(numbers), vision.detect_wall_grid(img))
+    result = solver.solve(timeout=10)
+    assert result and result.path == path
@@ -0,0 +1,135 @@
+"""
+Latency tracing for the capture-to-draw pipeline.
+Stages are timed as spans with time.perf_counter_ns(). A span opened inside another one is
+nested under it, so a run reads as e.g. "vision.numbers/vision.threshold". ZipVision,
+ZipSolver and ZipAutomation wrap their stages with @traced, which costs one attribute check
+while tracing is off.
+
+    from tracing import tracer
+    tracer.enable()
+    ...                             # Capture, solve, draw
+    tracer.print_summary()
+    tracer.save("zip_trace.json")   # tracer.save_chrome() for chrome://tracing / Perfetto
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Callable
+
+DEFAULT_TRACE = "zip_trace.json"
+DEFAULT_CHROME_TRACE = "zip_trace.chrome.json"
+
+@dataclass
+class Span:
+    name: str           # Stage name, e.g. "vision.grid"
+    path: str           # Names of the enclosing spans and this one, joined by "/"
+    depth: int          # 0 for a top-level stage
+    start_ns: int       # perf_counter_ns() when the stage started
+    duration_ns: int
+
+class Tracer:
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.spans: List[Span] = []     # In the order they finished
+        self.stack: List[str] = []      # Paths of the open spans
+        self.origin_ns = time.perf_counter_ns()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Forget all recorded spans and restart the clock, e.g. between runs."""
+        self.spans = []
+        self.stack = []
+        self.origin_ns = time.perf_counter_ns()
+
+    def span(self, name: str):
+        """Context manager timing one stage, a no-op while tracing is off."""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self.record(name)
+
+    @contextlib.contextmanager
+    def record(self, name: str):
+        path = f"{self.stack[-1]}/{name}" if self.stack else name
+        self.stack.append(path)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            self.stack.pop()
+            self.spans.append(Span(name, path, len(self.stack), start, duration))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per nested stage: calls, total, mean and max in milliseconds, in the order
+        the stages first started.
+        """
+        stages = {}
+        for span in sorted(self.spans, key=lambda span: span.start_ns):
+            stage = stages.setdefault(span.path, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "depth": span.depth})
+            stage["calls"] += 1
+            stage["total_ms"] += span.duration_ns / 1e6
+            stage["max_ms"] = max(stage["max_ms"], span.duration_ns / 1e6)
+        for stage in stages.values():
+            stage["mean_ms"] = stage["total_ms"] / stage["calls"]
+        return stages
+
+    def print_summary(self):
+        """Table of the time spent in every stage, nested stages indented under their parent."""
+        stages = self.summary()
+        if not stages:
+            print("⚠ No stages traced")
+            return
+        print(f"\n{'Stage':<36} {'Calls':>6} {'Total':>11} {'Mean':>11} {'Max':>11}")
+        print("-" * 79)
+        for path, stage in stages.items():
+            label = "  " * stage["depth"] + path.rsplit("/", 1)[-1]
+            print(f"{label:<36} {stage['calls']:>6} {stage['total_ms']:>9.2f}ms "
+                  f"{stage['mean_ms']:>9.2f}ms {stage['max_ms']:>9.2f}ms")
+
+    def save(self, path: str = DEFAULT_TRACE):
+        """Write the run as JSON: every span (times in ms from the start of the run) and the summary."""
+        spans = [dict(asdict(span), start_ms=(span.start_ns - self.origin_ns) / 1e6,
+                      duration_ms=span.duration_ns / 1e6)
+                 for span in sorted(self.spans, key=lambda span: span.start_ns)]
+        for span in spans:
+            del span["start_ns"], span["duration_ns"]
+        with open(path, "w") as f:
+            json.dump({"spans": spans, "summary": self.summary()}, f, indent=2)
+        print(f"✓ Trace saved to {path}")
+
+    def save_chrome(self, path: str = DEFAULT_CHROME_TRACE):
+        """
+        Write the run in Chrome trace-event format (complete "X" events, microseconds),
+        open it in chrome://tracing or ui.perfetto.dev.
+        """
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [{"name": span.name, "cat": span.name.split(".", 1)[0], "ph": "X", "pid": pid, "tid": tid,
+                   "ts": (span.start_ns - self.origin_ns) / 1e3, "dur": span.duration_ns / 1e3}
+                  for span in sorted(self.spans, key=lambda span: span.start_ns)]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        print(f"✓ Chrome trace saved to {path}")
+
+tracer = Tracer()   # Shared by everything that is instrumented
+
+def traced(name: str) -> Callable:
+    """Decorator timing every call of a function as a span called name."""
+    def decorate(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            with tracer.record(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -1,21 +1,37 @@
-import pyautogui
 import cv2
 import numpy as np
-from PIL import ImageGrab
 import time
+import json
+import os
 from typing import Tuple, List, Dict, Set, Optional
+from capture import ScreenCapture, make_capture
+from tracing import tracer, traced
+from recognizer import glyph_ink
+
+BOARD_CACHE = "board_area.json"    # Last board position found by locate_board()
+LOCATE_SCALE = 4                    # locate_board() searches a frame downscaled by this much first
+BOARD_CONFIDENCE = 0.8              # Grid confidence an area needs to be accepted as the board
 
 class ZipVision:
-    def __init__(self):
+    def __init__(self, capture: Optional[ScreenCapture] = None):
+        """
+        Args:
+            capture: Where frames come from (see capture.py), defaults to make_capture() on first capture
+        """
+        self.capture = capture
         self.board_area: Optional[Tuple[int, int, int, int]] = None  # (x, y, width, height)
         self.cell_size: Optional[Tuple[float, float]] = None
         self.grid_size: Optional[Tuple[int, int]] = None  # (rows, cols)
         self.cell_positions: Dict[Tuple[int, int], Tuple[int, int]] = {}  # Maps (row, col) -> (screen_x, screen_y)
+        self.row_bounds: List[float] = []  # Image y of each horizontal grid line, rows + 1 entries
+        self.col_bounds: List[float] = []  # Image x of each vertical grid line, cols + 1 entries
         
     def select_board_area(self):
         """
         Interactive: User clicks two corners to define the game board area.
         """
+        import pyautogui
+
         print("=" * 60)
         print("BOARD AREA SELECTION")
         print("=" * 60)
@@ -48,31 +64,131 @@ class ZipVision:
         print(f"\n✓ Board area set: {width}x{height} pixels at ({x}, {y})")
         print("=" * 60)
         
-    def capture_board(self) -> np.ndarray:
+    @traced("vision.locate")
+    def locate_board(self, screen: Optional[np.ndarray] = None, cache_path: Optional[str] = BOARD_CACHE) -> bool:
+        """
+        Find the game board on screen without clicking, replacing select_board_area().
+
+        The last position found is saved to cache_path. On later runs only that area is
+        captured and checked for a grid, the full screen is only searched if it moved.
+
+        Args:
+            screen: Full screen image (BGR) to search, captured if not given
+            cache_path: Where to keep the last board position, None to not cache
+
+        Returns:
+            True if the board was found and board_area is set
+        """
+        start = time.perf_counter()
+
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                x, y, width, height = json.load(f)["board_area"]
+            self.board_area = (x, y, width, height)
+            crop = self.capture_board(gray=True) if screen is None else screen[y:y + height, x:x + width]
+            if crop.size and self.board_confidence(crop) >= BOARD_CONFIDENCE:
+                print(f"✓ Board found at saved position: {width}x{height} pixels at ({x}, {y}) "
+                      f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+                return True
+            self.board_area = None
+            print("⚠ Board is no longer at the saved position, searching the screen")
+
+        if screen is None:
+            screen = self.screen_capture().grab(gray=True)
+
+        area = self.find_board(screen)
+        if area is None:
+            print("⚠ Couldn't find the board on screen")
+            return False
+
+        self.board_area = area
+        if cache_path:
+            with open(cache_path, "w") as f:
+                json.dump({"board_area": list(area)}, f)
+
+        x, y, width, height = area
+        print(f"✓ Board located: {width}x{height} pixels at ({x}, {y}) "
+              f"({(time.perf_counter() - start) * 1000:.0f} ms)")
+        return True
+
+    def find_board(self, screen: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Search a full screen image for the board.
+
+        Coarse: on a frame downscaled LOCATE_SCALE times, take the outlines of large
+        roughly square rectangles (the board is a rounded square) from the edge map.
+        Fine: for each one, largest first, look for grid lines at full resolution and
+        snap the area to the outer grid lines.
+
+        Returns:
+            (x, y, width, height) of the board, or None if no grid was found
+        """
+        gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY) if screen.ndim == 3 else screen
+        small = cv2.resize(gray, None, fx=1 / LOCATE_SCALE, fy=1 / LOCATE_SCALE, interpolation=cv2.INTER_AREA)
+
+        edges = cv2.dilate(cv2.Canny(small, 30, 100), np.ones((3, 3), np.uint8))
+        contours, _ = cv2.findContours(edges, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+
+        candidates = []
+        for contour in contours:
+            x, y, width, height = cv2.boundingRect(contour)
+            if width * height < small.size * 0.01 or not 0.75 <= width / height <= 1.33:
+                continue
+            if cv2.contourArea(contour) < width * height * 0.85:   # Rounded corners still fill most of the box
+                continue
+            candidates.append((width * height, x, y, width, height))
+
+        margin = LOCATE_SCALE * 2   # Covers the downscaling error
+        for _, x, y, width, height in sorted(candidates, reverse=True):
+            x1, y1 = max(0, x * LOCATE_SCALE - margin), max(0, y * LOCATE_SCALE - margin)
+            x2 = min(gray.shape[1], (x + width) * LOCATE_SCALE + margin)
+            y2 = min(gray.shape[0], (y + height) * LOCATE_SCALE + margin)
+            crop = gray[y1:y2, x1:x2]
+
+            row_lines = self.find_grid_lines(crop, axis=0)
+            col_lines = self.find_grid_lines(crop, axis=1)
+            if self.grid_confidence(row_lines, col_lines) < BOARD_CONFIDENCE:
+                continue
+
+            left, top = int(round(col_lines[0])), int(round(row_lines[0]))
+            right, bottom = int(round(col_lines[-1])), int(round(row_lines[-1]))
+            return (x1 + left, y1 + top, right - left + 1, bottom - top + 1)
+        return None
+
+    def board_confidence(self, img: np.ndarray) -> float:
+        """Grid confidence of an image, used to check an area still holds the board."""
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+        return self.grid_confidence(self.find_grid_lines(gray, axis=0), self.find_grid_lines(gray, axis=1))
+
+    def screen_capture(self) -> ScreenCapture:
+        """The capture backend, created on first use so vision on saved images never opens the screen."""
+        if self.capture is None:
+            self.capture = make_capture()
+        return self.capture
+
+    @traced("vision.capture")
+    def capture_board(self, gray: bool = False) -> np.ndarray:
         """
         Capture screenshot of the board area.
-        Returns OpenCV image (BGR format).
+        Returns OpenCV image (BGR format, or grayscale if gray is set).
         """
         if not self.board_area:
             raise ValueError("Board area not set! Call select_board_area() first.")
         
-        x, y, width, height = self.board_area
-        
-        # Capture screenshot
-        screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height))
-        
-        # Convert PIL image to OpenCV format (BGR)
-        img = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-        
-        return img
+        return self.screen_capture().grab(self.board_area, gray=gray)
     
-    def detect_grid_structure(self, img: np.ndarray, expected_size: Optional[Tuple[int, int]] = None):
+    @traced("vision.grid")
+    def detect_grid_structure(self, img: np.ndarray, expected_size: Optional[Tuple[int, int]] = None) -> float:
         """
         Detect grid structure by finding lines or using expected size.
         
         Args:
             img: OpenCV image of the board
             expected_size: (rows, cols) if you know the grid size
+
+        Returns:
+            Confidence in the detected grid from 0 to 1 (1 when expected_size is given).
+            Fall back to manual entry when it is low.
         """
         if not self.board_area:
             raise ValueError("Board area not set! Call select_board_area() first.")
@@ -80,32 +196,289 @@ class ZipVision:
         height, width = img.shape[:2]
         
         if expected_size:
-            # If we know the grid size, calculate cell positions directly
+            # If we know the grid size, cell boundaries are evenly spaced
             rows, cols = expected_size
-            self.grid_size = expected_size
-            
-            cell_width = width / cols
-            cell_height = height / rows
-            self.cell_size = (cell_width, cell_height)
-            
-            # Calculate center position of each cell
-            for row in range(rows):
-                for col in range(cols):
-                    center_x = int(self.board_area[0] + (col + 0.5) * cell_width)
-                    center_y = int(self.board_area[1] + (row + 0.5) * cell_height)
-                    self.cell_positions[(row, col)] = (center_x, center_y)
-            
-            print(f"✓ Grid structure detected: {rows}x{cols}")
-            print(f"✓ Cell size: {cell_width:.1f}x{cell_height:.1f} pixels")
-            print(f"✓ Mapped {len(self.cell_positions)} cell positions")
+            row_bounds = [row * height / rows for row in range(rows + 1)]
+            col_bounds = [col * width / cols for col in range(cols + 1)]
+            confidence = 1.0
         else:
-            # TODO: Implement automatic grid detection using edge detection
-            print("⚠ Automatic grid detection not implemented yet.")
-            print("   Please use expected_size parameter.")
+            # Find the grid lines from the row/column intensity profiles
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+            row_bounds = self.find_grid_lines(gray, axis=0)
+            col_bounds = self.find_grid_lines(gray, axis=1)
+            rows, cols = len(row_bounds) - 1, len(col_bounds) - 1
+            confidence = self.grid_confidence(row_bounds, col_bounds)
+
+            if rows < 2 or cols < 2:
+                print("⚠ Automatic grid detection couldn't find the grid lines.")
+                return 0.0
+
+        self.set_grid(row_bounds, col_bounds)
+        cell_width, cell_height = self.cell_size
+
+        print(f"✓ Grid structure detected: {rows}x{cols}" + ("" if expected_size else f" (confidence {confidence:.2f})"))
+        print(f"✓ Cell size: {cell_width:.1f}x{cell_height:.1f} pixels")
+        print(f"✓ Mapped {len(self.cell_positions)} cell positions")
+        return confidence
+
+    def set_grid(self, row_bounds: List[float], col_bounds: List[float]):
+        """Store cell boundaries (in image pixels) and map every cell centre to the screen."""
+        rows, cols = len(row_bounds) - 1, len(col_bounds) - 1
+        self.grid_size = (rows, cols)
+        self.row_bounds = list(row_bounds)
+        self.col_bounds = list(col_bounds)
+        self.cell_size = ((col_bounds[-1] - col_bounds[0]) / cols, (row_bounds[-1] - row_bounds[0]) / rows)
+
+        # Calculate center position of each cell
+        self.cell_positions = {}
+        for row in range(rows):
+            for col in range(cols):
+                center_x = int(self.board_area[0] + (col_bounds[col] + col_bounds[col + 1]) / 2)
+                center_y = int(self.board_area[1] + (row_bounds[row] + row_bounds[row + 1]) / 2)
+                self.cell_positions[(row, col)] = (center_x, center_y)
+
+    def apply_profile(self, profile):
+        """Take the board area and grid from a saved CalibrationProfile (see calibration.py)."""
+        self.board_area = tuple(profile.board_area)
+        self.set_grid(profile.row_bounds, profile.col_bounds)
+
+    @traced("vision.grid_check")
+    def grid_matches(self, img: np.ndarray) -> bool:
+        """
+        Check a capture against the current grid: same number of grid lines, each within
+        15% of a cell of where it was. Used to confirm a saved calibration still fits.
+        """
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+        row_lines = self.find_grid_lines(gray, axis=0)
+        col_lines = self.find_grid_lines(gray, axis=1)
+        if len(row_lines) != len(self.row_bounds) or len(col_lines) != len(self.col_bounds):
+            return False
+        cell_w, cell_h = self.cell_size
+        return (np.abs(np.subtract(row_lines, self.row_bounds)).max() <= cell_h * 0.15 and
+                np.abs(np.subtract(col_lines, self.col_bounds)).max() <= cell_w * 0.15)
+
+    @staticmethod
+    def find_grid_lines(gray: np.ndarray, axis: int) -> List[float]:
+        """
+        Positions of the grid lines across one axis (0 = horizontal lines, 1 = vertical lines).
+
+        A grid line is dark along the whole board while numbers and walls only cover part
+        of it, so each line is scored by the darkness that 90% of its middle reaches (over
+        a sample of 64 lines across). Peaks well above the background are grouped into
+        line centres, runs too wide for a line (a column of badges) are dropped, page
+        background reaching the image edge is cut off at the board, and the board edges
+        are added if the capture cropped the outer border off.
+        """
+        darkness = 255 - (gray if axis == 1 else gray.T)
+        length = darkness.shape[0]
+        step = max(1, length // 64)
+        # Only the middle of each line, so lines still count when the image has a margin
+        profile = np.percentile(darkness[length // 10:length - length // 10:step], 10, axis=0)
+
+        # Threshold halfway to a typical line, a dark outer border shouldn't hide light inner lines.
+        # Only runs inside the image set the line level: runs reaching the edge can be page
+        # background around the board (an off-white page is darker than the cells)
+        background = np.median(profile)
+        runs = ZipVision.runs(profile > background + 10)
+        inner = [profile[start:end] for start, end in runs if start > 0 and end < len(profile)]
+        candidates = np.concatenate(inner) if inner else profile[profile > background + 10]
+        if len(candidates) == 0:
+            return []
+        line_level = np.percentile(candidates, 25)
+        is_line = profile > background + (line_level - background) * 0.5
+
+        # Group runs of line pixels into line centres
+        runs = ZipVision.runs(is_line)
+        if not runs:
+            return []
+        centres = [(start + end - 1) / 2 for start, end in runs]
+        run_spacing = np.median(np.diff(centres)) if len(centres) > 1 else len(profile)
+        line_width = np.median([end - start for start, end in runs])
+        lines = []
+        for centre, (start, end) in zip(centres, runs):
+            if end - start <= line_width * 2 + 2 or (start > 0 and end < len(profile)):
+                if end - start <= run_spacing * 0.3:
+                    lines.append(centre)
+            # A dark page reaching the edge: the board starts where it ends
+            elif start == 0:
+                lines.append(float(end - 1))
+            else:
+                lines.append(float(start))
+        if len(lines) < 2:
+            return []
+
+        # Add the outer edges if the capture cut the border off
+        spacing = float(np.median(np.diff(lines)))
+        if lines[0] > spacing * 0.5:
+            lines.insert(0, 0.0)
+        if len(profile) - 1 - lines[-1] > spacing * 0.5:
+            lines.append(float(len(profile) - 1))
+
+        # Drop lines much closer than the typical spacing (anti-aliasing, double borders)
+        merged = [lines[0]]
+        for line in lines[1:]:
+            if line - merged[-1] < spacing * 0.5:
+                continue
+            merged.append(line)
+        return merged
+
+    @staticmethod
+    def runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+        """(start, end) of every run of True in a 1D mask, end exclusive."""
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], mask.astype(np.int8), [0]])))
+        return list(zip(edges[::2], edges[1::2]))
+
+    @staticmethod
+    def grid_confidence(row_bounds: List[float], col_bounds: List[float]) -> float:
+        """
+        How much the detected lines look like a Zip grid: evenly spaced lines in both
+        directions and roughly square cells. 1 is a perfect grid.
+        """
+        if len(row_bounds) < 3 or len(col_bounds) < 3:
+            return 0.0
+        row_gaps, col_gaps = np.diff(row_bounds), np.diff(col_bounds)
+        evenness = min(1 - row_gaps.std() / row_gaps.mean(), 1 - col_gaps.std() / col_gaps.mean())
+        squareness = min(row_gaps.mean(), col_gaps.mean()) / max(row_gaps.mean(), col_gaps.mean())
+        return float(max(0.0, evenness) * squareness)
     
-    def detect_numbers_at_cells(self, img: np.ndarray) -> Dict[Tuple[int, int], int]:
+    @traced("vision.threshold")
+    def threshold_board(self, img: np.ndarray) -> np.ndarray:
+        """Grayscale and threshold the whole board once (ink = 255)."""
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+        _, thresh = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY_INV)
+        return thresh
+
+    def cell_crops(self, img: np.ndarray, thresh: Optional[np.ndarray] = None,
+                   cells: Optional[List[Tuple[int, int]]] = None) -> Dict[Tuple[int, int], np.ndarray]:
+        """
+        Thresholded crop around the centre of each cell (ink = 255), as views into the thresholded board.
+
+        Args:
+            img: OpenCV image of the board
+            thresh: Board already passed through threshold_board(), to skip doing it again
+            cells: Only crop these cells, defaults to all of them
+        """
+        if thresh is None:
+            thresh = self.threshold_board(img)
+
+        crops = {}
+        cell_w, cell_h = self.cell_size
+        for cell in (cells if cells is not None else self.cell_positions):
+            screen_x, screen_y = self.cell_positions[cell]
+            # Convert screen coordinates to image coordinates
+            img_x = screen_x - self.board_area[0]
+            img_y = screen_y - self.board_area[1]
+            
+            # Extract small region around cell center
+            x1 = max(0, int(img_x - cell_w * 0.3))
+            y1 = max(0, int(img_y - cell_h * 0.3))
+            x2 = min(img.shape[1], int(img_x + cell_w * 0.3))
+            y2 = min(img.shape[0], int(img_y + cell_h * 0.3))
+            crops[cell] = thresh[y1:y2, x1:x2]
+        return crops
+
+    def ink_density(self, thresh: np.ndarray) -> np.ndarray:
+        """
+        Fraction of ink in the centre of every cell, shape (rows, cols).
+        Each cell's window is the middle 60% between its own grid lines (the same window as
+        cell_crops), so no rounding error builds up across the board. All windows are summed
+        at once from the board's integral image, four lookups per cell.
         """
-        Use OCR to detect numbers at each cell.
+        row_starts, row_ends = self.centre_windows(self.row_bounds, thresh.shape[0])
+        col_starts, col_ends = self.centre_windows(self.col_bounds, thresh.shape[1])
+
+        integral = cv2.integral(thresh)     # integral[y, x] = sum of thresh[:y, :x]
+        sums = (integral[np.ix_(row_ends, col_ends)] - integral[np.ix_(row_starts, col_ends)]
+                - integral[np.ix_(row_ends, col_starts)] + integral[np.ix_(row_starts, col_starts)])
+        areas = np.outer(row_ends - row_starts, col_ends - col_starts)
+        return (sums / (areas * 255)).astype(np.float32)
+
+    @staticmethod
+    def centre_windows(bounds: List[float], limit: int, fraction: float = 0.6) -> Tuple[np.ndarray, np.ndarray]:
+        """Start and end (exclusive) pixel of the middle fraction of every cell between bounds."""
+        bounds = np.asarray(bounds, dtype=float)
+        centres, sizes = (bounds[:-1] + bounds[1:]) / 2, np.diff(bounds)
+        starts = np.clip((centres - sizes * fraction / 2).astype(int), 0, limit - 1)
+        ends = np.clip((centres + sizes * fraction / 2).astype(int), starts + 1, limit)
+        return starts, ends
+
+    @traced("vision.prescreen")
+    def inked_cells(self, thresh: np.ndarray, min_ink: float = 0.03) -> List[Tuple[int, int]]:
+        """Cells with enough ink in their centre to possibly hold a number."""
+        rows, cols = np.nonzero(self.ink_density(thresh) >= min_ink)
+        return [(int(row), int(col)) for row, col in zip(rows, cols)]
+
+    @traced("vision.path_cells")
+    def path_cells(self, img: np.ndarray, min_fill: float = 0.15) -> np.ndarray:
+        """
+        Which cells the drawn path covers, shape (rows, cols). The path is the only
+        saturated colour on the board (cells are white/grey, numbers and walls black),
+        so a cell is filled when enough of it is saturated. Per-cell fractions come from
+        two np.add.reduceat passes over the grid lines, so uneven cells are handled too.
+
+        Args:
+            img: OpenCV image of the board (BGR, the test needs colour)
+            min_fill: Fraction of a cell that must be path coloured
+        """
+        saturation = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)[:, :, 1]
+        coloured = (saturation > 80).astype(np.int32)
+
+        row_starts = np.clip(np.round(self.row_bounds[:-1]).astype(int), 0, img.shape[0] - 1)
+        col_starts = np.clip(np.round(self.col_bounds[:-1]).astype(int), 0, img.shape[1] - 1)
+        row_ends = np.append(row_starts[1:], min(img.shape[0], int(round(self.row_bounds[-1]))))
+        col_ends = np.append(col_starts[1:], min(img.shape[1], int(round(self.col_bounds[-1]))))
+
+        coloured = coloured[:row_ends[-1], :col_ends[-1]]
+        counts = np.add.reduceat(np.add.reduceat(coloured, row_starts, axis=0), col_starts, axis=1)
+        areas = np.outer(row_ends - row_starts, col_ends - col_starts)
+        return counts / np.maximum(areas, 1) >= min_fill
+
+    @traced("vision.ocr")
+    def ocr_mosaic(self, crops: Dict[Tuple[int, int], np.ndarray]) -> Dict[Tuple[int, int], int]:
+        """
+        OCR many crops with a single Tesseract call: tile them left to right on one
+        padded strip and map every word back to its tile by its x position. Each tile
+        holds only the number's ink (glyph_ink), so a light number on a dark badge is
+        tiled the same way as a dark number on the plain cell.
+        """
+        import pytesseract
+
+        glyphs = {cell: glyph_ink(crop) for cell, crop in crops.items()}
+        cells = [cell for cell, ink in glyphs.items() if ink.size]
+        if not cells:
+            return {}
+        tile_h = max(glyphs[cell].shape[0] for cell in cells) + 20
+        tile_w = max(glyphs[cell].shape[1] for cell in cells) + 20
+        mosaic = np.zeros((tile_h, tile_w * len(cells)), dtype=np.uint8)
+        for index, cell in enumerate(cells):
+            ink = glyphs[cell]
+            top = (tile_h - ink.shape[0]) // 2
+            left = index * tile_w + (tile_w - ink.shape[1]) // 2
+            mosaic[top:top + ink.shape[0], left:left + ink.shape[1]] = ink
+
+        # Tesseract reads dark text on a light background: black numbers on a white strip
+        config = '--psm 7 --oem 3 -c tessedit_char_whitelist=0123456789'
+        data = pytesseract.image_to_data(cv2.bitwise_not(mosaic), config=config,
+                                         output_type=pytesseract.Output.DICT)
+
+        numbers = {}
+        for text, left, width in zip(data["text"], data["left"], data["width"]):
+            text = text.strip()
+            if text.isdigit():
+                index = min(len(cells) - 1, (left + width // 2) // tile_w)
+                numbers[cells[index]] = int(text)
+        return numbers
+
+    @traced("vision.numbers")
+    def detect_numbers_at_cells(self, img: np.ndarray, recognizer=None) -> Dict[Tuple[int, int], int]:
+        """
+        Detect numbers at each cell. An ink pre-screen skips blank cells, the rest go to the
+        in-process recognizer if it has templates, otherwise to one batched Tesseract call.
+
+        Args:
+            img: OpenCV image of the board
+            recognizer: Optional DigitRecognizer (see recognizer.py)
+
         Returns dict mapping (row, col) -> number.
         """
         if not self.cell_positions:
@@ -116,6 +489,20 @@ class ZipVision:
         
         if not self.cell_size:
             raise ValueError("Cell size not detected! Call detect_grid_structure() first.")
+
+        thresh = self.threshold_board(img)
+        cells = self.inked_cells(thresh)
+        if not cells:
+            return {}
+        crops = self.cell_crops(img, thresh, cells)
+
+        if recognizer is not None and recognizer.has_templates():
+            # Classify every inked cell in one batch
+            with tracer.span("vision.classify"):
+                glyphs = np.stack([recognizer.normalize_glyph(crops[cell]) for cell in cells])
+                labels = recognizer.classify(glyphs)
+            return {cell: label for cell, label in zip(cells, labels) if label is not None}
+
         # Try to import pytesseract for OCR
         try:
             import pytesseract
@@ -123,35 +510,8 @@ class ZipVision:
             print("⚠ pytesseract not installed. Install with: pip install pytesseract")
             print("   Also needs Tesseract-OCR installed on system")
             return {}
-        
-        numbers = {}
-        
-        for cell, (screen_x, screen_y) in self.cell_positions.items():
-            # Convert screen coordinates to image coordinates
-            img_x = screen_x - self.board_area[0]
-            img_y = screen_y - self.board_area[1]
-            
-            # Extract small region around cell center
-            cell_w, cell_h = self.cell_size
-            x1 = max(0, int(img_x - cell_w * 0.3))
-            y1 = max(0, int(img_y - cell_h * 0.3))
-            x2 = min(img.shape[1], int(img_x + cell_w * 0.3))
-            y2 = min(img.shape[0], int(img_y + cell_h * 0.3))
-            
-            cell_img = img[y1:y2, x1:x2]
-            
-            # Convert to grayscale and threshold
-            gray = cv2.cvtColor(cell_img, cv2.COLOR_BGR2GRAY)
-            _, thresh = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY_INV)
-            
-            # OCR to detect number
-            config = '--psm 10 --oem 3 -c tessedit_char_whitelist=0123456789'
-            text = pytesseract.image_to_string(thresh, config=config).strip()
-            
-            if text.isdigit():
-                numbers[cell] = int(text)
-        
-        return numbers
+
+        return self.ocr_mosaic(crops)
     
     def detect_walls(self, img: np.ndarray) -> Set[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
@@ -160,46 +520,60 @@ class ZipVision:
         """
         if not self.cell_size or not self.grid_size:
             return set()
-        
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        
+
+        walls = self.wall_edges(*self.detect_wall_grid(img))
+        print(f"Detected {len(walls)} walls")
+        return walls
+
+    @traced("vision.walls")
+    def detect_wall_grid(self, img: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Detect walls on every edge of the grid at once.
+
+        A window is sampled around the middle of each edge, its size scaled to the cell.
+        All windows are views into one sliding-window view of the thresholded board,
+        so each direction is decided by a single mean over the stacked windows.
+
+        Returns:
+            (horizontal, vertical) boolean arrays. horizontal[r, c] is a wall between
+            (r, c) and (r+1, c), shape (rows-1, cols). vertical[r, c] is a wall between
+            (r, c) and (r, c+1), shape (rows, cols-1). ZipSolver accepts the pair as walls.
+        """
+        rows, cols = self.grid_size
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+
         # Detect black lines (walls are black)
         _, binary = cv2.threshold(gray, 50, 255, cv2.THRESH_BINARY_INV)
-        
-        walls = set()
+
+        # Sample across the wall thickness and along the middle of the edge
         cell_w, cell_h = self.cell_size
-        rows, cols = self.grid_size
-        
-        # Check horizontal edges
-        for row in range(rows - 1):
-            for col in range(cols):
-                # Sample middle of edge between (row, col) and (row+1, col)
-                sample_x = int(col * cell_w + cell_w * 0.5)
-                sample_y = int((row + 1) * cell_h)
-                
-                if 0 <= sample_y < binary.shape[0] and 0 <= sample_x < binary.shape[1]:
-                    # Check if there's a thick black line
-                    region = binary[max(0, sample_y-5):min(binary.shape[0], sample_y+5), 
-                                   max(0, sample_x-10):min(binary.shape[1], sample_x+10)]
-                    if region.size > 0 and region.mean() > 150:  # Mostly white (wall)
-                        walls.add(((row, col), (row + 1, col)))
-        
-        # Check vertical edges
-        for row in range(rows):
-            for col in range(cols - 1):
-                # Sample middle of edge between (row, col) and (row, col+1)
-                sample_x = int((col + 1) * cell_w)
-                sample_y = int(row * cell_h + cell_h * 0.5)
-                
-                if 0 <= sample_y < binary.shape[0] and 0 <= sample_x < binary.shape[1]:
-                    region = binary[max(0, sample_y-10):min(binary.shape[0], sample_y+10),
-                                   max(0, sample_x-5):min(binary.shape[1], sample_x+5)]
-                    if region.size > 0 and region.mean() > 150:  # Mostly white (wall)
-                        walls.add(((row, col), (row, col + 1)))
-        
-        print(f"Detected {len(walls)} walls")
+        band = max(1, int(min(cell_w, cell_h) * 0.05))
+        reach = max(1, int(min(cell_w, cell_h) * 0.2))
+
+        line_ys = np.asarray(self.row_bounds[1:-1])
+        line_xs = np.asarray(self.col_bounds[1:-1])
+        centre_ys = (np.asarray(self.row_bounds[:-1]) + self.row_bounds[1:]) / 2
+        centre_xs = (np.asarray(self.col_bounds[:-1]) + self.col_bounds[1:]) / 2
+
+        def edge_windows(ys: np.ndarray, xs: np.ndarray, height: int, width: int) -> np.ndarray:
+            # Windows of (height, width) centred on every (y, x) pair, shape (len(ys), len(xs))
+            windows = np.lib.stride_tricks.sliding_window_view(binary, (height, width))
+            tops = np.clip(ys.astype(int) - height // 2, 0, windows.shape[0] - 1)
+            lefts = np.clip(xs.astype(int) - width // 2, 0, windows.shape[1] - 1)
+            return windows[tops[:, None], lefts[None, :]].mean(axis=(2, 3)) > 150  # Mostly white (wall)
+
+        horizontal = edge_windows(line_ys, centre_xs, 2 * band, 2 * reach)
+        vertical = edge_windows(centre_ys, line_xs, 2 * reach, 2 * band)
+        return horizontal.reshape(rows - 1, cols), vertical.reshape(rows, cols - 1)
+
+    @staticmethod
+    def wall_edges(horizontal: np.ndarray, vertical: np.ndarray) -> Set[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Convert the (horizontal, vertical) wall arrays from detect_wall_grid() to a set of edges."""
+        walls = {((row, col), (row + 1, col)) for row, col in np.argwhere(horizontal).tolist()}
+        walls |= {((row, col), (row, col + 1)) for row, col in np.argwhere(vertical).tolist()}
         return walls
 
+    @traced("vision.pairs")
     def identify_pairs_from_numbers(self, numbers: Dict[Tuple[int, int], int]) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
         Create pairs from numbered nodes: n → n+1
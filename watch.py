@@ -0,0 +1,199 @@
+"""
+Watch mode: keep an eye on the board area and solve every new puzzle the moment it appears.
+Run with: py watch.py [frames per second] [--chrome-trace]
+Every board drawn gets a stage by stage trace, from the frame that showed it to the end of drawing.
+"""
+import cv2
+import numpy as np
+import sys
+import time
+from enum import Enum
+from typing import Tuple, Optional
+from vision import ZipVision
+from solver import ZipSolver
+from automation import ZipAutomation
+from input_backend import make_input
+from recognizer import DigitRecognizer, DEFAULT_TEMPLATES
+from solution_cache import SolutionCache
+from calibration import CalibrationProfile, DEFAULT_PROFILE
+from tracing import tracer, DEFAULT_TRACE, DEFAULT_CHROME_TRACE
+
+WATCH_FPS = 20.0            # Captures per second while waiting for a puzzle
+WATCH_SCALE = 8             # Frames are downscaled this much before differencing
+CHANGE_THRESHOLD = 6.0      # Mean absolute difference (0-255) of the small frames that counts as a new board
+WATCH_SOLVE_TIMEOUT = 10.0  # Seconds before the solver gives up on a board
+MIN_GRID_CONFIDENCE = 0.8   # Boards detected with less confidence are skipped
+
+class FrameResult(Enum):
+    DRAWN = "drawn"             # New board, solved and drawn
+    SEEN = "seen"               # The board drawn last time, nothing to do
+    UNREADABLE = "unreadable"   # No readable or solvable board in the frame
+
+class BoardWatcher:
+    def __init__(self, vision: ZipVision, recognizer: Optional[DigitRecognizer] = None,
+                 fps: float = WATCH_FPS, threshold: float = CHANGE_THRESHOLD,
+                 move_duration: float = 0.05, pause_at_cell: float = 0.1,
+                 draw_mode: str = "turns", step_interval: float = 0.01,
+                 verify_drawing: bool = True, input_backend: str = "pyautogui",
+                 solution_cache: Optional[SolutionCache] = None, chrome_trace: bool = False):
+        """
+        Args:
+            vision: ZipVision with the board area set (locate_board() or select_board_area())
+            recognizer: Digit recognizer for the numbers, Tesseract is used without one
+            fps: Captures per second while watching
+            threshold: Frame difference that triggers a solve, see CHANGE_THRESHOLD
+            move_duration, pause_at_cell, draw_mode, step_interval: Drawing settings for ZipAutomation
+            verify_drawing: Check each drawn path on screen and redraw missed cells
+            input_backend: Mouse input backend, one of INPUT_BACKENDS
+            solution_cache: Boards solved before are drawn straight from this cache
+            chrome_trace: Also write the trace of each board in Chrome trace-event format
+        """
+        if not vision.board_area:
+            raise ValueError("Board area not set! Call locate_board() or select_board_area() first.")
+
+        self.vision = vision
+        self.recognizer = recognizer
+        self.interval = 1.0 / fps
+        self.threshold = threshold
+        self.move_duration = move_duration
+        self.pause_at_cell = pause_at_cell
+        self.draw_mode = draw_mode
+        self.step_interval = step_interval
+        self.verify_drawing = verify_drawing
+        self.input = make_input(input_backend)     # Kept for every board drawn
+        self.solution_cache = solution_cache
+        self.chrome_trace = chrome_trace
+        self.last_puzzle = None     # Fingerprint of the last board solved, so it isn't drawn twice
+
+    @staticmethod
+    def thumbnail(gray: np.ndarray) -> np.ndarray:
+        """Small grayscale frame for cheap differencing."""
+        height, width = gray.shape
+        return cv2.resize(gray, (max(1, width // WATCH_SCALE), max(1, height // WATCH_SCALE)),
+                          interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def difference(frame: np.ndarray, reference: np.ndarray) -> float:
+        return float(cv2.absdiff(frame, reference).mean())
+
+    def read_board(self, gray: np.ndarray) -> Optional[Tuple]:
+        """
+        Run vision on a frame without any prompts.
+
+        Returns:
+            (grid_size, numbers, pairs, walls), or None if the frame doesn't hold a readable board
+        """
+        vision = self.vision
+        if vision.detect_grid_structure(gray) < MIN_GRID_CONFIDENCE:
+            return None
+        numbers = vision.detect_numbers_at_cells(gray, self.recognizer)
+        if len(numbers) < 2:
+            return None
+        pairs = vision.identify_pairs_from_numbers(numbers)
+        if not pairs:
+            return None
+        walls = vision.wall_edges(*vision.detect_wall_grid(gray))
+        return vision.grid_size, numbers, pairs, walls
+
+    def run(self, max_puzzles: Optional[int] = None):
+        """
+        Watch until interrupted (or max_puzzles have been drawn). The board as it is when
+        watching starts counts as already seen, the next change to it triggers a solve.
+        """
+        print(f"Watching {self.vision.board_area} at {1 / self.interval:.0f} fps, Ctrl+C to stop")
+        reference = self.thumbnail(self.vision.capture_board(gray=True))
+        last_attempt = None     # Frame that last failed to read, not retried until it changes
+        solved = 0
+
+        while max_puzzles is None or solved < max_puzzles:
+            frame_start = time.perf_counter()
+            tracer.reset()      # Only the frame that shows a new board is worth keeping
+            gray = self.vision.capture_board(gray=True)
+            captured_at = time.perf_counter()
+            thumb = self.thumbnail(gray)
+
+            changed = self.difference(thumb, reference) > self.threshold
+            retry = last_attempt is None or self.difference(thumb, last_attempt) > self.threshold / 4
+            if changed and retry:
+                result = self.fire(gray, captured_at)
+                if result != FrameResult.UNREADABLE:
+                    if result == FrameResult.DRAWN:
+                        solved += 1
+                    reference, last_attempt = self.thumbnail(self.vision.capture_board(gray=True)), None
+                    continue
+                last_attempt = thumb
+
+            time.sleep(max(0.0, self.interval - (time.perf_counter() - frame_start)))
+
+    def fire(self, gray: np.ndarray, captured_at: float) -> FrameResult:
+        """
+        Read, solve and draw the board in a changed frame.
+
+        Returns:
+            DRAWN for a new board, SEEN for the board drawn last time, UNREADABLE otherwise
+        """
+        board = self.read_board(gray)
+        if board is None:
+            return FrameResult.UNREADABLE
+        grid_size, numbers, pairs, walls = board
+
+        puzzle = (grid_size, frozenset(numbers.items()), frozenset(walls))
+        if puzzle == self.last_puzzle:
+            return FrameResult.SEEN
+        read_at = time.perf_counter()
+
+        solver = ZipSolver(grid_size, pairs, walls or None, solution_cache=self.solution_cache)
+        result = solver.solve(timeout=WATCH_SOLVE_TIMEOUT)
+        solved_at = time.perf_counter()
+        if not result:
+            print(f"⚠ No solution for the new board ({result.status.name.lower()})")
+            return FrameResult.UNREADABLE
+        self.last_puzzle = puzzle
+
+        print(f"\n✓ New {grid_size[0]}x{grid_size[1]} board: vision {(read_at - captured_at) * 1000:.0f} ms, "
+              f"solve {(solved_at - read_at) * 1000:.0f} ms{' (cached)' if result.cached else ''}, "
+              f"trigger to draw {(solved_at - captured_at) * 1000:.0f} ms "
+              f"(+ up to {self.interval * 1000:.0f} ms between frames)")
+
+        automation = ZipAutomation(self.vision.cell_positions, self.move_duration, self.pause_at_cell,
+                                   self.draw_mode, self.step_interval, input_backend=self.input)
+        if self.verify_drawing:
+            automation.draw_and_verify(solver.solution_path, self.vision, countdown=0)
+
+            # Keep the adapted speed for the next board
+            self.step_interval, self.pause_at_cell = automation.step_interval, automation.pause_at_cell
+        else:
+            automation.draw_path(solver.solution_path, countdown=0)
+
+        if tracer.enabled:
+            tracer.print_summary()
+            tracer.save(DEFAULT_TRACE)
+            if self.chrome_trace:
+                tracer.save_chrome(DEFAULT_CHROME_TRACE)
+        return FrameResult.DRAWN
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    fps = float(args[0]) if args else WATCH_FPS
+    tracer.enable()
+    vision = ZipVision()
+    profile = CalibrationProfile.load(DEFAULT_PROFILE)
+    if profile:
+        # One capture confirms the saved board area, like main.py
+        vision.apply_profile(profile)
+        if not vision.grid_matches(vision.capture_board()):
+            print("⚠ Saved calibration doesn't match the screen, locating the board again")
+            vision.board_area = None
+    if not vision.board_area and not vision.locate_board():
+        vision.select_board_area()
+
+    settings = {"move_duration": profile.move_duration, "pause_at_cell": profile.pause_at_cell,
+                "draw_mode": profile.draw_mode, "step_interval": profile.step_interval,
+                "verify_drawing": profile.verify_drawing, "input_backend": profile.input_backend} if profile else {}
+    templates_path = profile.templates_path if profile else DEFAULT_TEMPLATES
+    watcher = BoardWatcher(vision, DigitRecognizer(templates_path), fps=fps, solution_cache=SolutionCache(),
+                           chrome_trace="--chrome-trace" in sys.argv, **settings)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("\n⚠ Stopped watching")